@@ -1,13 +1,23 @@
 """Background image manager for handling level-based backgrounds."""
+import hashlib
 import pygame
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Scaled backgrounds are cached here between runs
+CACHE_DIR = Path.home() / ".cache" / "logastroids"
+
+# Cache files are a small header (magic, width, height) followed by raw RGB pixels
+CACHE_HEADER = struct.Struct("<4sII")
+CACHE_MAGIC = b"LABG"
+
 
 class BackgroundManager:
     """Manages background images with automatic switching based on level progression."""
     
-    def __init__(self, window_width, window_height, backgrounds=None, levels_per_background=5):
+    def __init__(self, window_width, window_height, backgrounds=None, levels_per_background=5, preload=None):
         """Initialize background manager.
         
         Args:
@@ -15,6 +25,7 @@ class BackgroundManager:
             window_height: Height of the game window
             backgrounds: List of background image filenames (relative to images/ directory)
             levels_per_background: Number of levels before switching to next background
+            preload: Optional list of background filenames to load up front instead of on first use
         """
         self.window_width = window_width
         self.window_height = window_height
@@ -25,50 +36,176 @@ class BackgroundManager:
             backgrounds = ["pixel-starfield.png"]
         
         self.background_files = backgrounds
+        # Backgrounds are loaded lazily on first use and memoized here
         self.loaded_backgrounds = {}
+        # Background loads for upcoming levels run on a worker thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = {}
+        # Memo of level -> background filename
+        self._level_files = {}
         self.current_background = None
         self.current_level = 1
         
-        # Load all backgrounds
         script_dir = Path(__file__).parent
-        images_dir = script_dir / "images"
+        self.images_dir = script_dir / "images"
+        
+        for bg_file in preload or []:
+            self._get_background(bg_file)
+        
+        # Set initial background
+        self.update_background_for_level(1)
+    
+    def _get_background(self, bg_file):
+        """Return the scaled background for a file, loading it on first request.
         
-        for bg_file in self.background_files:
-            bg_path = images_dir / bg_file
+        Args:
+            bg_file: Background image filename (relative to images/ directory)
+            
+        Returns:
+            pygame.Surface or None: Scaled background, or None if loading failed
+        """
+        if bg_file not in self.loaded_backgrounds:
+            future = self._pending.pop(bg_file, None)
             try:
-                self.loaded_backgrounds[bg_file] = self._load_and_scale_background(bg_path)
+                if future is not None:
+                    # Joins the worker if the prefetch hasn't finished yet
+                    background = future.result()
+                else:
+                    background = self._load_and_scale_background(self.images_dir / bg_file)
+                # Pixel format conversion needs the display, so it stays on the main thread.
+                # Matching the display format with no surface alpha or colorkey keeps the
+                # per-frame full-screen blit on SDL's straight copy path.
+                background = background.convert(pygame.display.get_surface())
+                background.set_alpha(None)
+                background.set_colorkey(None)
+                self.loaded_backgrounds[bg_file] = background
             except Exception as e:
                 print(f"Warning: failed to load background {bg_file}: {e}")
                 self.loaded_backgrounds[bg_file] = None
+        return self.loaded_backgrounds[bg_file]
+    
+    def prefetch(self, level):
+        """Start loading the background for a level on the worker thread.
         
-        # Set initial background
-        self.update_background_for_level(1)
+        Args:
+            level: Game level whose background should be warmed
+        """
+        bg_file = self._background_file_for_level(level)
+        if bg_file in self.loaded_backgrounds or bg_file in self._pending:
+            return
+        self._pending[bg_file] = self._executor.submit(
+            self._load_and_scale_background, self.images_dir / bg_file
+        )
     
-    def _load_and_scale_background(self, bg_path):
+    def _load_and_scale_background(self, bg_path, smooth=None):
         """Load and scale a background image to cover the window with aspect ratio preserved.
         
+        Safe to call from the prefetch worker: the result is not converted to the
+        display format yet.
+        
         Args:
             bg_path: Path to the background image
+            smooth: Use filtered scaling (True) or point sampling (False). Defaults
+                to point sampling for pixel-art files (name contains "pixel")
+                that are being enlarged, which is faster and keeps their hard
+                edges; shrinking always filters so single-pixel detail survives.
             
         Returns:
-            pygame.Surface: Scaled and cropped background, or None if loading failed
+            pygame.Surface: Scaled and cropped background
         """
-        bg_img = pygame.image.load(bg_path).convert()
+        cache_path = self._cache_path(bg_path, smooth)
+        background = self._read_cached_background(cache_path)
+        if background is not None:
+            return background
+        
+        bg_img = pygame.image.load(bg_path)
         src_w, src_h = bg_img.get_width(), bg_img.get_height()
+        if bg_img.get_bitsize() < 24:
+            # smoothscale only takes 24/32-bit surfaces, and convert() needs the
+            # display, so expand palette and grayscale images to 32-bit here
+            expanded = pygame.Surface((src_w, src_h), pygame.SRCALPHA, 32)
+            expanded.blit(bg_img, (0, 0))
+            bg_img = expanded
         
         # Scale factor to cover the window entirely while preserving aspect ratio
         scale = max(self.window_width / src_w, self.window_height / src_h)
-        new_w, new_h = int(src_w * scale), int(src_h * scale)
-        scaled = pygame.transform.smoothscale(bg_img, (new_w, new_h))
+        if smooth is None:
+            smooth = scale < 1 or "pixel" not in bg_path.stem
         
-        # Create a window-sized surface and blit scaled image centered (cropped)
-        background = pygame.Surface((self.window_width, self.window_height))
-        offset_x = (self.window_width - new_w) // 2
-        offset_y = (self.window_height - new_h) // 2
-        background.blit(scaled, (offset_x, offset_y))
+        # Crop the source to the centered region that ends up on screen before
+        # scaling, so smoothscale (already an area-averaging filter when shrinking)
+        # only processes pixels that are actually visible
+        crop_w = min(src_w, round(self.window_width / scale))
+        crop_h = min(src_h, round(self.window_height / scale))
+        crop_x = (src_w - crop_w) // 2
+        crop_y = (src_h - crop_h) // 2
+        visible = bg_img.subsurface((crop_x, crop_y, crop_w, crop_h))
+        if visible.get_size() == (self.window_width, self.window_height):
+            # Source already matches the window (after cropping): no scaling needed
+            background = visible
+        elif smooth:
+            background = pygame.transform.smoothscale(visible, (self.window_width, self.window_height))
+        else:
+            background = pygame.transform.scale(visible, (self.window_width, self.window_height))
+        
+        # Backgrounds are drawn opaque: flatten per-pixel alpha onto black here so
+        # the later convert() doesn't expose the color of transparent pixels
+        if background.get_flags() & pygame.SRCALPHA:
+            opaque = pygame.Surface((self.window_width, self.window_height))
+            opaque.blit(background, (0, 0))
+            background = opaque
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            header = CACHE_HEADER.pack(CACHE_MAGIC, self.window_width, self.window_height)
+            cache_path.write_bytes(header + pygame.image.tobytes(background, "RGB"))
+        except (OSError, pygame.error) as e:
+            print(f"Warning: failed to cache background {bg_path.name}: {e}")
         
         return background
     
+    def _read_cached_background(self, cache_path):
+        """Load a scaled background from the raw pixel cache.
+        
+        Reading the pixels back is a single sequential read with no image
+        decoding or scaling.
+        
+        Args:
+            cache_path: Path returned by _cache_path
+            
+        Returns:
+            pygame.Surface or None: Cached background, or None if missing or invalid
+        """
+        try:
+            data = cache_path.read_bytes()
+        except OSError:
+            return None
+        
+        size = (self.window_width, self.window_height)
+        expected = CACHE_HEADER.size + size[0] * size[1] * 3
+        if len(data) != expected or CACHE_HEADER.unpack_from(data) != (CACHE_MAGIC, *size):
+            return None
+        return pygame.image.frombuffer(memoryview(data)[CACHE_HEADER.size:], size, "RGB")
+    
+    def _cache_path(self, bg_path, smooth):
+        """Return the on-disk cache location for a scaled background.
+        
+        The key covers the source path, its modification time, the window size
+        and the scaling mode, so editing the image or resizing the window
+        invalidates the entry.
+        
+        Args:
+            bg_path: Path to the source background image
+            smooth: Whether filtered scaling was requested (None for automatic)
+            
+        Returns:
+            Path: Cache file path (may not exist yet)
+        """
+        mode = {True: "smooth", False: "nearest", None: "auto"}[smooth]
+        key = f"{bg_path}|{bg_path.stat().st_mtime_ns}|{self.window_width}x{self.window_height}|{mode}"
+        digest = hashlib.blake2b(key.encode()).hexdigest()[:16]
+        return CACHE_DIR / f"bg-{digest}.raw"
+    
     def update_background_for_level(self, level):
         """Update the current background based on the level.
         
@@ -76,12 +213,20 @@ class BackgroundManager:
             level: Current game level
         """
         self.current_level = level
+        bg_file = self._background_file_for_level(level)
+        self.current_background = self._get_background(bg_file)
         
-        # Calculate which background to use based on level
-        bg_index = ((level - 1) // self.levels_per_background) % len(self.background_files)
-        bg_file = self.background_files[bg_index]
-        
-        self.current_background = self.loaded_backgrounds.get(bg_file)
+        # Warm the next level's background so the level switch doesn't stall
+        self.prefetch(level + 1)
+    
+    def _background_file_for_level(self, level):
+        """Return the background filename used for a level."""
+        bg_file = self._level_files.get(level)
+        if bg_file is None:
+            # Calculate which background to use based on level
+            bg_index = ((level - 1) // self.levels_per_background) % len(self.background_files)
+            bg_file = self._level_files[level] = self.background_files[bg_index]
+        return bg_file
     
     def get_current_background(self):
         """Get the current background surface.
@@ -102,3 +247,20 @@ class BackgroundManager:
             screen.blit(self.current_background, (0, 0))
         else:
             screen.fill(fallback_color)
+    
+    def restore(self, screen, rects, fallback_color=(0, 0, 0)):
+        """Redraw the current background over areas of the screen.
+        
+        Like Group.clear, but every area is copied with a single blits call.
+        
+        Args:
+            screen: pygame.Surface to draw on
+            rects: Screen areas to restore
+            fallback_color: Color tuple to use if no background is available
+        """
+        background = self.current_background
+        if background:
+            screen.blits([(background, rect, rect) for rect in rects], doreturn=False)
+        else:
+            for rect in rects:
+                screen.fill(fallback_color, rect)
@@ -0,0 +1,85 @@
+"""Broad-phase collision helpers."""
+
+# Cell edge in pixels: about twice the largest asteroid hitbox radius, so any
+# sprite that can touch an asteroid lies in the asteroid's cell or a neighbour
+ASTEROID_CELL_SIZE = 96
+
+
+def collide_circle_sq(left, right):
+    """Circle overlap test for sprites that both define radius.
+
+    Same result as pygame.sprite.collide_circle (squared center distance vs.
+    squared radius sum, touching counts as a hit) without its attribute
+    fallbacks and ** calls.
+    """
+    lx, ly = left.rect.center
+    rx, ry = right.rect.center
+    dx = lx - rx
+    dy = ly - ry
+    reach = left.radius + right.radius
+    return dx * dx + dy * dy <= reach * reach
+
+
+class SpatialHash:
+    """Uniform grid bucketing sprites by the cell containing their center."""
+
+    def __init__(self, cell_size=ASTEROID_CELL_SIZE):
+        """Initialize an empty grid.
+
+        Args:
+            cell_size: Cell edge length in pixels. Must be at least the largest
+                center-to-center distance at which two sprites can collide.
+        """
+        self.cell_size = cell_size
+        # (gx, gy) -> [sprite, ...]; each sprite is in exactly one cell
+        self.cells = {}
+
+    def rebuild(self, sprites):
+        """Clear the grid and insert every sprite in an iterable."""
+        self.cells.clear()
+        for sprite in sprites:
+            self.add(sprite)
+
+    def add(self, sprite):
+        """Insert a sprite into the cell under its rect center."""
+        cx, cy = sprite.rect.center
+        key = (cx // self.cell_size, cy // self.cell_size)
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [sprite]
+        else:
+            cell.append(sprite)
+
+    def nearby(self, sprite):
+        """Return the sprites in the 3x3 block of cells around a sprite."""
+        cx, cy = sprite.rect.center
+        cx //= self.cell_size
+        cy //= self.cell_size
+        cells = self.cells
+        found = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = cells.get((gx, gy))
+                if cell is not None:
+                    found += cell
+        return found
+
+    def collide(self, sprite, collided=None):
+        """Return grid sprites that collide with a sprite, like spritecollide.
+
+        Sprites killed since the last rebuild are skipped, and a pooled sprite
+        recycled and re-added since then is only reported once.
+
+        Args:
+            sprite: Sprite to test against the grid
+            collided: Optional callback taking (sprite, other) and returning a
+                bool, e.g. pygame.sprite.collide_circle. Defaults to rect overlap.
+
+        Returns:
+            list: Colliding sprites still in a group
+        """
+        others = dict.fromkeys(self.nearby(sprite))
+        if collided is None:
+            rect = sprite.rect
+            return [other for other in others if other.alive() and rect.colliderect(other.rect)]
+        return [other for other in others if other.alive() and collided(sprite, other)]
@@ -10,6 +10,10 @@ ASTEROID_MIN_SPEED = 1.0
 ASTEROID_MAX_SPEED = 3.0
 ASTEROID_ROTATION_RANGE = (-3.0, 3.0)
 
+# Derived values, precomputed so per-frame code doesn't redo the arithmetic
+HALF_WINDOW = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+ASTEROID_SPEED_RANGE = ASTEROID_MAX_SPEED - ASTEROID_MIN_SPEED
+
 # Level System Constants
 LEVEL_1_INITIAL_ASTEROIDS = 5  # Number of asteroids spawned at level start
 LEVEL_1_MAX_ON_SCREEN = 5  # Max asteroids on screen at once
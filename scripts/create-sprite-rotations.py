@@ -1,20 +1,94 @@
+import json
+import math
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from PIL import Image
 
+# Large sources are box-reduced by an integer factor until they are at most this
+# many times the sprite size; the per-frame transform does the rest
+RESIZE_REDUCING_GAP = 2
+
+# Source image and output sprite size for worker processes, set once per worker by _init_worker
+_worker_src = None
+_worker_size = None
+
+
+def _init_worker(mode, size, data, sprite_size):
+    """Rebuild the source image in a worker so it isn't pickled per frame."""
+    global _worker_src, _worker_size
+    _worker_src = Image.frombytes(mode, size, data)
+    _worker_size = sprite_size
+
+
+def _rotate_frame(angle):
+    """Rotate the worker's source image clockwise by angle, scaled to the sprite size, and return raw RGBA bytes."""
+    # 'expand=False' keeps the size 96x96, clipping corners if the ship is too wide.
+    # Ensure your ship has some empty padding in the source image to avoid clipping!
+    if _worker_src.size == (_worker_size, _worker_size):
+        # Negative because PIL rotates counter-clockwise
+        rotated_frame = _worker_src.rotate(-angle, resample=Image.Resampling.BICUBIC, expand=False)
+        return rotated_frame.tobytes()
+
+    # Scale + rotate about the center in a single resample pass: the affine
+    # matrix maps each output pixel back to its source coordinate
+    src_w, src_h = _worker_src.size
+    scale_x = src_w / _worker_size
+    scale_y = src_h / _worker_size
+    theta = math.radians(angle)
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    a, b = cos_t * scale_x, sin_t * scale_x
+    d, e = -sin_t * scale_y, cos_t * scale_y
+    half = _worker_size / 2
+    c = src_w / 2 - (a * half + b * half)
+    f = src_h / 2 - (d * half + e * half)
+    rotated_frame = _worker_src.transform((_worker_size, _worker_size), Image.Transform.AFFINE,
+                                          (a, b, c, d, e, f), resample=Image.Resampling.BICUBIC)
+    return rotated_frame.tobytes()
+
+
+def _manifest_path(output_path):
+    """Return the path of the JSON file recording how a sheet was generated."""
+    return Path(output_path).with_suffix(".manifest.json")
+
+
+def _is_up_to_date(source_path, output_path, params):
+    """Check whether the sheet is newer than its source and was built with the same parameters."""
+    output = Path(output_path)
+    try:
+        if output.stat().st_mtime < Path(source_path).stat().st_mtime:
+            return False
+        return json.loads(_manifest_path(output).read_text()) == params
+    except (OSError, ValueError):
+        return False
+
 
 def create_rotational_spritesheet(source_path, output_path, sprite_size, angle_increment):
+    # Skip the rebuild when the existing sheet already matches the source and settings
+    params = {"source": str(source_path), "sprite_size": sprite_size, "angle_increment": angle_increment}
+    if _is_up_to_date(source_path, output_path, params):
+        print(f"Up to date: {output_path}")
+        return
+
     try:
         # Load the source image (Expects a transparent PNG)
         # Ensure the source is facing UP (0 degrees) for correct rotation logic
-        src_img = Image.open(source_path).convert("RGBA")
+        src_img = Image.open(source_path)
     except FileNotFoundError:
         print(f"Error: Could not find '{source_path}'. Please ensure the file exists.")
         return
 
-    # resize source if it isn't already the correct size
-    if src_img.size != (sprite_size, sprite_size):
-        src_img = src_img.resize((sprite_size, sprite_size), Image.Resampling.LANCZOS)
+    # Let libjpeg decode JPEG sources at a reduced DCT scale (still >= 2x the
+    # sprite size, so the per-frame transform has detail to work with)
+    if src_img.format == "JPEG":
+        src_img.draft("RGB", (sprite_size * 2, sprite_size * 2))
+    src_img = src_img.convert("RGBA")
+
+    # Bicubic sampling only looks at a 4x4 neighbourhood, so box-reduce very large
+    # sources first; the final scale to sprite_size happens in each frame's transform
+    factor = min(src_img.size) // (RESIZE_REDUCING_GAP * sprite_size)
+    if factor > 1:
+        src_img = src_img.reduce(factor)
 
     # Calculate Grid Dimensions
     total_frames = int(360 / angle_increment) # 24 frames
@@ -31,14 +105,14 @@ def create_rotational_spritesheet(source_path, output_path, sprite_size, angle_i
 
     print(f"Generating {total_frames} frames...")
 
-    for i in range(total_frames):
-        # Calculate angle (Negative because PIL rotates counter-clockwise)
-        angle = i * angle_increment
-        
-        # Rotate the image
-        # 'expand=False' keeps the size 96x96, clipping corners if the ship is too wide.
-        # Ensure your ship has some empty padding in the source image to avoid clipping!
-        rotated_frame = src_img.rotate(-angle, resample=Image.Resampling.BICUBIC, expand=False)
+    # Frames are independent, so rotate them in parallel worker processes
+    angles = [i * angle_increment for i in range(total_frames)]
+    with ProcessPoolExecutor(initializer=_init_worker,
+                             initargs=(src_img.mode, src_img.size, src_img.tobytes(), sprite_size)) as executor:
+        frames = list(executor.map(_rotate_frame, angles))
+
+    for i, frame_data in enumerate(frames):
+        rotated_frame = Image.frombytes(src_img.mode, (sprite_size, sprite_size), frame_data)
         
         # Calculate position on the grid
         col_idx = i % columns
@@ -52,6 +126,7 @@ def create_rotational_spritesheet(source_path, output_path, sprite_size, angle_i
 
     # Save the result
     sprite_sheet.save(output_path)
+    _manifest_path(output_path).write_text(json.dumps(params, indent=2) + "\n")
     print(f"Success! Saved sprite sheet to: {output_path}")
 
 # --- Configuration ---
@@ -17,6 +17,45 @@ import math
 from pathlib import Path
 from PIL import Image
 
+# Box-reduce by an integer factor first when shrinking by more than this ratio
+RESIZE_REDUCING_GAP = 3.0
+
+
+def to_indexed(sheet):
+    """
+    Convert an RGBA sheet to an equivalent palette image, if that is lossless.
+    
+    Only sheets whose alpha is fully on/off and that use at most 255 opaque
+    colors qualify; the remaining palette index marks transparent pixels.
+    
+    Args:
+        sheet: RGBA image
+    
+    Returns:
+        Tuple of (mode "P" image, transparent index), or None if the sheet
+        needs full RGBA
+    """
+    alpha = sheet.getchannel("A")
+    if alpha.point(lambda v: 0 if v in (0, 255) else 255).getbbox():
+        return None
+    
+    # Transparent pixels all map to one index, whatever their color values
+    colors = sheet.getcolors(256 + 255)
+    if colors is None:
+        return None
+    opaque = [rgba[:3] for _, rgba in colors if rgba[3] == 255]
+    if len(opaque) > 255:
+        return None
+    
+    transparent_index = len(opaque)
+    # Map every pixel to its palette index directly; quantize() looks colors up
+    # through a reduced-precision cache and can merge nearby colors
+    index_of = {rgb: i for i, rgb in enumerate(opaque)}
+    indexed = Image.new("P", sheet.size)
+    indexed.putpalette([v for rgb in opaque for v in rgb] + [0, 0, 0] * (256 - len(opaque)))
+    indexed.putdata([index_of[rgba[:3]] if rgba[3] == 255 else transparent_index for rgba in sheet.getdata()])
+    return indexed, transparent_index
+
 
 def create_sprite_sheet(image_paths, output_base, sprite_size, max_cols=10):
     """
@@ -38,10 +77,14 @@ def create_sprite_sheet(image_paths, output_base, sprite_size, max_cols=10):
     sprites = []
     for img_path in image_paths:
         try:
-            img = Image.open(img_path).convert("RGBA")
-            # Resize to target sprite size
+            img = Image.open(img_path)
+            # JPEG sources can be decoded at a reduced DCT scale close to the target size
+            if img.format == "JPEG":
+                img.draft("RGB", (sprite_size * 2, sprite_size * 2))
+            img = img.convert("RGBA")
+            # Resize to target sprite size (box-reducing large sources before Lanczos)
             if img.size != (sprite_size, sprite_size):
-                img = img.resize((sprite_size, sprite_size), Image.Resampling.LANCZOS)
+                img = img.resize((sprite_size, sprite_size), Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
             sprites.append(img)
         except Exception as e:
             print(f"Warning: Could not load {img_path}: {e}")
@@ -70,12 +113,20 @@ def create_sprite_sheet(image_paths, output_base, sprite_size, max_cols=10):
     
     # Generate output filename with format: BASE-PIXELSpx-COLxROW.png
     output_filename = f"{output_base}-{sprite_size}px-{cols}x{rows}.png"
-    sprite_sheet.save(output_filename)
+    # Sheets with hard-edged alpha and few colors are written as 8-bit indexed
+    # PNGs, which are a fraction of the size and faster to decode in-game
+    indexed = to_indexed(sprite_sheet)
+    if indexed is not None:
+        indexed_sheet, transparent_index = indexed
+        indexed_sheet.save(output_filename, transparency=transparent_index)
+    else:
+        sprite_sheet.save(output_filename)
     
     print(f"✓ Created sprite sheet: {output_filename}")
     print(f"  - Grid: {cols} columns × {rows} rows")
     print(f"  - Sprites: {num_sprites}")
     print(f"  - Size: {sheet_width}×{sheet_height} pixels")
+    print(f"  - Format: {'indexed' if indexed is not None else 'RGBA'}")
     
     return output_filename
 
@@ -3,11 +3,18 @@ import pygame
 import math
 import os
 import random
+from bisect import bisect_right
+from itertools import accumulate
+from pygame.locals import (
+    QUIT, KEYDOWN, KEYUP, MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEWHEEL, ACTIVEEVENT,
+    K_ESCAPE, K_RETURN, K_BACKSPACE, K_F1, K_SPACE, K_b, K_p,
+)
+from pygame.sprite import spritecollide
 
 # Import from modules
 from constants import (
-    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, BLACK,
-    BULLET_SPEED, ASTEROID_MIN_SPEED, ASTEROID_MAX_SPEED, ASTEROID_ROTATION_RANGE,
+    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, BLACK, HALF_WINDOW,
+    BULLET_SPEED, ASTEROID_MIN_SPEED, ASTEROID_SPEED_RANGE, ASTEROID_ROTATION_RANGE,
     LEVEL_1_INITIAL_ASTEROIDS, LEVEL_1_MAX_ON_SCREEN, LEVEL_1_TOTAL_ASTEROIDS,
     LEVEL_1_SPAWN_INTERVAL, LEVEL_PROGRESSION_INITIAL, LEVEL_PROGRESSION_MAX,
     LEVEL_PROGRESSION_TOTAL, LEVEL_PROGRESSION_SPAWN_REDUCTION,
@@ -15,9 +22,10 @@ from constants import (
     POWERUP_SPAWN_CHANCE, HEALTH_POWERUP_WEIGHT, INVULNERABILITY_POWERUP_WEIGHT,
     ROCKETS_POWERUP_WEIGHT, SHIELDS_POWERUP_WEIGHT
 )
-from sprites import Spaceship, Bullet, Rocket, Asteroid, Explosion, PowerUp, BossShip, Fireball
+from sprites import Spaceship, Bullet, Rocket, Asteroid, Explosion, PowerUp, BossShip, Fireball, FastGroup
 from utils import (
     load_sheet,
+    preload_sheets,
     load_specs_dict,
     load_specs_list,
     load_powerup_sprites,
@@ -30,6 +38,7 @@ from utils import (
     ROCKET_SPECS,
     BOSS_SPEC,
     FIREBALL_SPEC,
+    POWERUP_SPEC,
 )
 from ui import (
     draw_health, draw_score, draw_level, draw_game_over, draw_start_screen,
@@ -37,16 +46,64 @@ from ui import (
     draw_rockets, draw_invulnerability
 )
 from background_manager import BackgroundManager
+from collision import SpatialHash, collide_circle_sq
 
 # Initialize Pygame
 pygame.init()
 
 
+# Unit vectors for the three child asteroids a large asteroid splits into, 120 degrees apart
+CHILD_DIRECTIONS = tuple(
+    (math.cos((i * 120) * math.pi / 180), math.sin((i * 120) * math.pi / 180)) for i in range(3)
+)
+
+# Power-up types with their cumulative drop weights, for one bisect per roll.
+# Rolls are scaled by the total, so the weights don't have to sum to 1
+POWERUP_TYPES = (PowerUp.HEALTH, PowerUp.INVULNERABILITY, PowerUp.ROCKETS, PowerUp.SHIELDS)
+POWERUP_CDF = tuple(accumulate((
+    HEALTH_POWERUP_WEIGHT, INVULNERABILITY_POWERUP_WEIGHT, ROCKETS_POWERUP_WEIGHT, SHIELDS_POWERUP_WEIGHT,
+)))
+
+# Asteroid spawn points per screen edge (top, bottom, left, right), 100px outside
+# the window: the fixed (x, y) coordinate, with None for the random one
+ASTEROID_SPAWN_MARGIN = 100
+ASTEROID_SPAWN_EDGES = (
+    (None, -ASTEROID_SPAWN_MARGIN),
+    (None, WINDOW_HEIGHT + ASTEROID_SPAWN_MARGIN),
+    (-ASTEROID_SPAWN_MARGIN, None),
+    (WINDOW_WIDTH + ASTEROID_SPAWN_MARGIN, None),
+)
+
+
+def _compute_level_params(level):
+    """Return (initial, max_on_screen, total, spawn_interval_frames) for a level."""
+    initial = LEVEL_1_INITIAL_ASTEROIDS + (level - 1) * LEVEL_PROGRESSION_INITIAL
+    max_on_screen = LEVEL_1_MAX_ON_SCREEN + (level - 1) * LEVEL_PROGRESSION_MAX
+    total = LEVEL_1_TOTAL_ASTEROIDS + (level - 1) * LEVEL_PROGRESSION_TOTAL
+    spawn_interval = max(1.0, LEVEL_1_SPAWN_INTERVAL - (level - 1) * LEVEL_PROGRESSION_SPAWN_REDUCTION)
+    return initial, max_on_screen, total, int(spawn_interval * FPS)
+
+
+# Level parameters precomputed for the levels normally reached in play
+LEVEL_TABLE = tuple(_compute_level_params(level) for level in range(1, 64))
+
+
+def get_level_params(level):
+    """Return (initial, max_on_screen, total, spawn_interval_frames) for a level."""
+    if level <= len(LEVEL_TABLE):
+        return LEVEL_TABLE[level - 1]
+    # Levels past the table (reachable with the level-skip cheat) are computed on demand
+    return _compute_level_params(level)
+
+
 def main():
     """Main game loop"""
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Asteroid-Style Spaceship Game")
     clock = pygame.time.Clock()
+    # The game never reads mouse or focus events; have SDL drop them instead of
+    # queueing them for the event loop to skip
+    pygame.event.set_blocked((MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEWHEEL, ACTIVEEVENT))
 
     # Load audio
     gun_sound = None
@@ -103,7 +160,11 @@ def main():
     
     # Load spritesheets
     script_dir = os.path.dirname(__file__)
-    # Load sprite sheets using declarative specs
+    # Load sprite sheets using declarative specs, decoding them in parallel first
+    preload_sheets([
+        *SHIP_SPECS, *FIRE_SPECS, SHIELD_SPEC, *DAMAGE_SPECS, *ASTEROID_STAGE_SPECS,
+        *BROKEN_ASTEROID_SPECS, *ROCKET_SPECS, BOSS_SPEC, FIREBALL_SPEC, POWERUP_SPEC,
+    ])
     ship_sheets = load_specs_dict(SHIP_SPECS)
     fire_sheets = load_specs_dict(FIRE_SPECS)
     shield_sprites = load_sheet(SHIELD_SPEC)
@@ -128,71 +189,75 @@ def main():
         shield_hit_sound=shield_hit_sound,
         ship_destroyed_sound=ship_destroyed_sound,
         rocket_sound=rocket_sound,
-        x=WINDOW_WIDTH // 2,
-        y=WINDOW_HEIGHT // 2,
+        x=HALF_WINDOW[0],
+        y=HALF_WINDOW[1],
     )
 
     # Load power-up sprites
     powerup_sprites = load_powerup_sprites()
     
     # Sprite groups
-    all_sprites = pygame.sprite.Group()
-    bullets = pygame.sprite.Group()
-    rockets = pygame.sprite.Group()
-    asteroids = pygame.sprite.Group()
-    explosions = pygame.sprite.Group()
-    powerups = pygame.sprite.Group()
-    bosses = pygame.sprite.Group()
-    fireballs = pygame.sprite.Group()
+    all_sprites = FastGroup()
+    bullets = FastGroup()
+    rockets = FastGroup()
+    asteroids = FastGroup()
+    explosions = FastGroup()
+    powerups = FastGroup()
+    bosses = FastGroup()
+    fireballs = FastGroup()
+    # Groups drawn each frame, back to front (the spaceship is added on top)
+    draw_layers = (bullets, rockets, asteroids, explosions, powerups, bosses, fireballs)
+    # Broad phase for asteroid collisions, rebuilt once per frame after movement
+    asteroid_grid = SpatialHash()
 
     all_sprites.add(spaceship)
 
     def spawn_asteroid():
         # Spawn asteroids off-screen and have them float in
-        spawn_margin = 100
-        edge = random.choice(['top', 'bottom', 'left', 'right'])
-        
-        if edge == 'top':
-            x = random.uniform(0, WINDOW_WIDTH)
-            y = -spawn_margin
-        elif edge == 'bottom':
-            x = random.uniform(0, WINDOW_WIDTH)
-            y = WINDOW_HEIGHT + spawn_margin
-        elif edge == 'left':
-            x = -spawn_margin
-            y = random.uniform(0, WINDOW_HEIGHT)
-        else:  # right
-            x = WINDOW_WIDTH + spawn_margin
-            y = random.uniform(0, WINDOW_HEIGHT)
+        uniform = random.uniform  # bound once; called three times per asteroid
+        x, y = ASTEROID_SPAWN_EDGES[random.randrange(4)]
+        if x is None:
+            x = uniform(0, WINDOW_WIDTH)
+        else:
+            y = uniform(0, WINDOW_HEIGHT)
         
         # Give velocity directed generally toward the screen center
-        center_x = WINDOW_WIDTH / 2
-        center_y = WINDOW_HEIGHT / 2
+        center_x, center_y = HALF_WINDOW
         dx = center_x - x
         dy = center_y - y
-        dist = math.hypot(dx, dy)
-        if dist > 0:
-            dir_x = dx / dist
-            dir_y = dy / dist
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > 0:
+            # One reciprocal square root instead of a sqrt and two divisions
+            inv_dist = dist_sq ** -0.5
+            dir_x = dx * inv_dist
+            dir_y = dy * inv_dist
         else:
             dir_x, dir_y = 0, 0
         
         # Random speed with inward component
-        speed = random.uniform(ASTEROID_MIN_SPEED, ASTEROID_MAX_SPEED)
+        speed = ASTEROID_MIN_SPEED + random.random() * ASTEROID_SPEED_RANGE
         vx = dir_x * speed
         vy = dir_y * speed
         
-        rotation = random.uniform(0, 360)
-        rotation_speed = random.uniform(*ASTEROID_ROTATION_RANGE)
+        rotation = uniform(0, 360)
+        rotation_speed = uniform(*ASTEROID_ROTATION_RANGE)
         # Ensure some spin
         if abs(rotation_speed) < 0.3:
             rotation_speed = 0.3 if rotation_speed >= 0 else -0.3
-        asteroid = Asteroid(asteroid_stage_sheets, 0, x, y, vx, vy, rotation, rotation_speed)
+        asteroid = Asteroid.spawn(asteroid_stage_sheets, 0, x, y, vx, vy, rotation, rotation_speed)
         asteroids.add(asteroid)
         all_sprites.add(asteroid)
+        asteroid_grid.add(asteroid)
+
+    def spawn_asteroids(count):
+        """Spawn a batch of asteroids and count them against the level total."""
+        nonlocal asteroids_spawned_this_level
+        for _ in range(count):
+            spawn_asteroid()
+        asteroids_spawned_this_level += count
 
     def create_explosion(x, y, rotation_angle, rotation_speed, vx, vy):
-        explosion = Explosion(broken_sheets, x, y, rotation_angle, rotation_speed, vx, vy)
+        explosion = Explosion.spawn(broken_sheets, x, y, rotation_angle, rotation_speed, vx, vy)
         explosions.add(explosion)
         all_sprites.add(explosion)
 
@@ -206,20 +271,10 @@ def main():
     boss_instance = None
     boss_fire_timer = 0
     
-    def get_level_params(level):
-        initial = LEVEL_1_INITIAL_ASTEROIDS + (level - 1) * LEVEL_PROGRESSION_INITIAL
-        max_on_screen = LEVEL_1_MAX_ON_SCREEN + (level - 1) * LEVEL_PROGRESSION_MAX
-        total = LEVEL_1_TOTAL_ASTEROIDS + (level - 1) * LEVEL_PROGRESSION_TOTAL
-        spawn_interval = max(1.0, LEVEL_1_SPAWN_INTERVAL - (level - 1) * LEVEL_PROGRESSION_SPAWN_REDUCTION)
-        return initial, max_on_screen, total, spawn_interval
-    
-    initial_asteroids, max_asteroids, total_asteroids, spawn_interval_seconds = get_level_params(current_level)
-    spawn_interval_frames = int(spawn_interval_seconds * FPS)
+    initial_asteroids, max_asteroids, total_asteroids, spawn_interval_frames = get_level_params(current_level)
     
     # Seed initial asteroids for level 1
-    for _ in range(initial_asteroids):
-        spawn_asteroid()
-        asteroids_spawned_this_level += 1
+    spawn_asteroids(initial_asteroids)
     
     spawn_timer = 0
     respawn_timer = 0
@@ -235,40 +290,59 @@ def main():
     fade_in = False
     fade_in_timer = 0
     FADE_IN_DURATION = int(0.5 * FPS)  # 0.5 seconds
+    # Black overlay for the fade-in, built once in the display format; only its
+    # alpha changes per frame
+    fade_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    fade_surface.fill(BLACK)
     high_scores = load_high_scores()
     entering_name = False
     player_name = ""
     cheat_mode = False
     cheat_buffer = ""
     running = True
+    # Keys currently held down, kept up to date from KEYDOWN/KEYUP events
+    held_keys = set()
+    # Dirty-rect drawing state: screen areas drawn last frame, and the background
+    # they were drawn over
+    dirty_rects = []
+    last_background = None
+    full_redraw = True
     
     # Start intro music
     if intro_music:
         intro_music.play(-1)
 
-    def jump_to_level(target_level):
+    def start_level(level):
+        """Reset the level counters and limits for a level and seed its asteroids."""
         nonlocal current_level
         nonlocal asteroids_spawned_this_level
         nonlocal asteroids_destroyed_this_level
+        nonlocal max_asteroids
+        nonlocal total_asteroids
         nonlocal spawn_interval_frames
         nonlocal spawn_timer
-        nonlocal boss_active
-        nonlocal boss_instance
-        nonlocal boss_fire_timer
 
-        current_level = max(1, target_level)
+        current_level = level
         asteroids_spawned_this_level = 0
         asteroids_destroyed_this_level = 0
+
+        # Update background for new level
+        background_manager.update_background_for_level(current_level)
+
+        initial_asteroids, max_asteroids, total_asteroids, spawn_interval_frames = get_level_params(current_level)
+
+        spawn_asteroids(initial_asteroids)
+        spawn_timer = 0
+
+    def jump_to_level(target_level):
+        nonlocal boss_active
+        nonlocal boss_instance
+
         boss_active = False
         if boss_instance:
             boss_instance.kill()
             boss_instance = None
 
-        background_manager.update_background_for_level(current_level)
-
-        initial_asteroids, max_asteroids, total_asteroids, spawn_interval_seconds = get_level_params(current_level)
-        spawn_interval_frames = int(spawn_interval_seconds * FPS)
-
         bullets.empty()
         rockets.empty()
         asteroids.empty()
@@ -277,297 +351,330 @@ def main():
         bosses.empty()
         fireballs.empty()
 
-        for _ in range(initial_asteroids):
+        start_level(max(1, target_level))
+    
+    def destroy_asteroid(asteroid, drops=True):
+        """Score a destroyed asteroid and spawn its explosion, drops, children and replacement.
+
+        With drops=False no power-up is rolled and no child asteroids are spawned.
+        """
+        nonlocal score
+        nonlocal asteroids_destroyed_this_level
+        nonlocal asteroids_spawned_this_level
+        nonlocal spawn_timer
+
+        score += 10
+        asteroids_destroyed_this_level += 1
+        create_explosion(asteroid.x, asteroid.y, asteroid.rotation, asteroid.rotation_speed, asteroid.vx, asteroid.vy)
+        if asteroid_destroyed_sound:
+            asteroid_destroyed_sound.play()
+        
+        # Randomly spawn a power-up when asteroid is destroyed
+        if drops and random.random() < POWERUP_SPAWN_CHANCE:
+            roll = random.random() * POWERUP_CDF[-1]
+            powerup_type = POWERUP_TYPES[min(bisect_right(POWERUP_CDF, roll), len(POWERUP_TYPES) - 1)]
+            
+            powerup_sprite = powerup_sprites[powerup_type]
+            powerup = PowerUp(asteroid.x, asteroid.y, powerup_type, powerup_sprite)
+            powerups.add(powerup)
+            all_sprites.add(powerup)
+        
+        # Spawn child asteroids if this is a parent asteroid and level >= 3
+        if drops and asteroid.spawn_children and asteroid.scale == 1.0 and current_level >= 3:
+            child_scale = 0.5
+            for dir_x, dir_y in CHILD_DIRECTIONS:
+                child_speed = 2.0
+                child_vx = asteroid.vx + dir_x * child_speed
+                child_vy = asteroid.vy + dir_y * child_speed
+                
+                offset_dist = 30
+                child_x = asteroid.x + dir_x * offset_dist
+                child_y = asteroid.y + dir_y * offset_dist
+                
+                child_asteroid = Asteroid.spawn(asteroid_stage_sheets, 2, child_x, child_y, child_vx, child_vy, 
+                                                random.uniform(0, 360), random.uniform(*ASTEROID_ROTATION_RANGE),
+                                                scale=child_scale, spawn_children=False)
+                asteroids.add(child_asteroid)
+                all_sprites.add(child_asteroid)
+                asteroid_grid.add(child_asteroid)
+        
+        asteroid.kill()
+        
+        # Spawn a new asteroid immediately when one is destroyed (if limits allow)
+        if (len(asteroids) < max_asteroids and 
+            asteroids_spawned_this_level < total_asteroids):
             spawn_asteroid()
             asteroids_spawned_this_level += 1
+            spawn_timer = 0
+
+    def select_key_handler():
+        """Return the KEYDOWN handler for the current game mode."""
+        if entering_name:
+            return handle_name_entry_key
+        if cheat_mode:
+            return handle_cheat_key
+        if game_started and not game_over:
+            return handle_play_key
+        return handle_menu_key
+
+    def handle_name_entry_key(event):
+        nonlocal high_scores
+        nonlocal entering_name
+        nonlocal player_name
+
+        if event.key == K_RETURN:
+            if player_name.strip():
+                high_scores = add_high_score(player_name.strip(), score, current_level, high_scores)
+                save_high_scores(high_scores)
+            entering_name = False
+            player_name = ""
+        elif event.key == K_BACKSPACE:
+            player_name = player_name[:-1]
+            if typing_sound:
+                typing_sound.play()
+        elif len(player_name) < 12 and event.unicode.isprintable():
+            player_name += event.unicode
+            if typing_sound:
+                typing_sound.play()
+
+    def handle_cheat_key(event):
+        nonlocal cheat_mode
+        nonlocal cheat_buffer
+
+        if event.key == K_RETURN:
+            if cheat_buffer.isdigit():
+                jump_to_level(int(cheat_buffer))
+            cheat_mode = False
+            cheat_buffer = ""
+        elif event.key == K_ESCAPE:
+            cheat_mode = False
+            cheat_buffer = ""
+        elif event.key == K_BACKSPACE:
+            cheat_buffer = cheat_buffer[:-1]
+        elif event.unicode.isdigit() and len(cheat_buffer) < 3:
+            cheat_buffer += event.unicode
+
+    def handle_play_key(event):
+        nonlocal cheat_mode
+        nonlocal cheat_buffer
+
+        if event.key == K_F1:
+            cheat_mode = True
+            cheat_buffer = ""
+        elif event.key == K_SPACE:
+            bullet = spaceship.fire()
+            if bullet:
+                bullets.add(bullet)
+                all_sprites.add(bullet)
+                if gun_sound:
+                    gun_sound.stop()
+                    gun_sound.play()
+        elif event.key == K_b:
+            rocket = spaceship.fire_rocket()
+            if rocket:
+                rockets.add(rocket)
+                all_sprites.add(rocket)
+
+    def start_transition():
+        nonlocal starting_transition
+        nonlocal starting_transition_timer
+
+        starting_transition = True
+        starting_transition_timer = 0
+        if intro_music:
+            intro_music.stop()
+        if start_sound:
+            start_sound.play()
+            # Calculate duration in frames (get length in seconds, multiply by FPS)
+            starting_transition_timer = int(start_sound.get_length() * FPS)
+        else:
+            # Fallback if sound fails to load
+            starting_transition_timer = int(2 * FPS)
+
+    def restart_game():
+        nonlocal game_over
+        nonlocal current_level
+        nonlocal asteroids_spawned_this_level
+        nonlocal asteroids_destroyed_this_level
+        nonlocal boss_active
+        nonlocal boss_instance
+        nonlocal score
+        nonlocal entering_name
+        nonlocal player_name
+        nonlocal game_over_delay_timer
+        nonlocal max_asteroids
+        nonlocal total_asteroids
+        nonlocal spawn_interval_frames
+        nonlocal spaceship
+        nonlocal spawn_timer
+        nonlocal respawn_timer
+
+        game_over = False
+        start_transition()
+        current_level = 1
+        asteroids_spawned_this_level = 0
+        asteroids_destroyed_this_level = 0
+        boss_active = False
+        if boss_instance:
+            boss_instance.kill()
+            boss_instance = None
+        score = 0
+        entering_name = False
+        player_name = ""
+        game_over_delay_timer = 0
+        
+        all_sprites.empty()
+        bullets.empty()
+        rockets.empty()
+        asteroids.empty()
+        explosions.empty()
+        powerups.empty()
+        bosses.empty()
+        fireballs.empty()
+        
+        initial_asteroids, max_asteroids, total_asteroids, spawn_interval_frames = get_level_params(current_level)
+        
+        spaceship = Spaceship(
+            sprites_static=ship_sheets.get("static", []),
+            sprites_thrust=ship_sheets.get("thrust", []),
+            damage_sprites=damage_sprites,
+            shield_sprites=shield_sprites,
+            fire_thrust_left=fire_sheets.get("fire_thrust_left", []),
+            fire_thrust_right=fire_sheets.get("fire_thrust_right", []),
+            fire_static_left=fire_sheets.get("fire_static_left", []),
+            fire_static_right=fire_sheets.get("fire_static_right", []),
+            rocket_sheets=rocket_sheets,
+            shield_hit_sound=shield_hit_sound,
+            ship_destroyed_sound=ship_destroyed_sound,
+            x=HALF_WINDOW[0],
+            y=HALF_WINDOW[1],
+        )
+        all_sprites.add(spaceship)
+        
+        spawn_asteroids(initial_asteroids)
         spawn_timer = 0
+        respawn_timer = 0
+
+    def handle_menu_key(event):
+        # Start screen, starting transition and game over (outside name entry)
+        if event.key == K_p:
+            if not game_started and not starting_transition:
+                start_transition()
+            elif game_over:
+                restart_game()
+    
+    def select_menu_frame():
+        """Return the frame function for the current menu screen, or None while playing."""
+        if starting_transition:
+            return draw_transition_frame
+        if not game_started:
+            return draw_start_frame
+        if game_over:
+            return draw_game_over_frame
+        return None
+
+    def draw_transition_frame():
+        # Black screen while the start sound plays, then start the game with a fade-in
+        nonlocal starting_transition
+        nonlocal starting_transition_timer
+        nonlocal game_started
+        nonlocal fade_in
+        nonlocal fade_in_timer
+
+        starting_transition_timer -= 1
+        if starting_transition_timer <= 0:
+            # Transition complete, start the game with fade-in
+            starting_transition = False
+            game_started = True
+            fade_in = True
+            fade_in_timer = FADE_IN_DURATION
+            pygame.mixer.music.play(-1, fade_ms=500)  # Fade in music over 500ms
+        screen.fill(BLACK)
+
+    def draw_start_frame():
+        background_manager.draw(screen, BLACK)
+        draw_start_screen(screen)
+
+    def draw_game_over_frame():
+        background_manager.draw(screen, BLACK)
+        draw_game_over(screen, score, high_scores, entering_name, player_name)
     
     while running:
         clock.tick(FPS)
         
-        # Event handling
+        # Event handling. The key handler for the current mode is looked up once,
+        # and again only after a handler ran, since handlers are what change modes
+        # while the queue is drained
+        key_handler = select_key_handler()
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == QUIT:
                 running = False
-            if event.type == pygame.KEYDOWN:
-                if entering_name:
-                    if event.key == pygame.K_RETURN:
-                        if player_name.strip():
-                            high_scores = add_high_score(player_name.strip(), score, current_level, high_scores)
-                            save_high_scores(high_scores)
-                        entering_name = False
-                        player_name = ""
-                    elif event.key == pygame.K_BACKSPACE:
-                        player_name = player_name[:-1]
-                        if typing_sound:
-                            typing_sound.play()
-                    elif len(player_name) < 12 and event.unicode.isprintable():
-                        player_name += event.unicode
-                        if typing_sound:
-                            typing_sound.play()
-                elif cheat_mode:
-                    if event.key == pygame.K_RETURN:
-                        if cheat_buffer.isdigit():
-                            jump_to_level(int(cheat_buffer))
-                        cheat_mode = False
-                        cheat_buffer = ""
-                    elif event.key == pygame.K_ESCAPE:
-                        cheat_mode = False
-                        cheat_buffer = ""
-                    elif event.key == pygame.K_BACKSPACE:
-                        cheat_buffer = cheat_buffer[:-1]
-                    elif event.unicode.isdigit() and len(cheat_buffer) < 3:
-                        cheat_buffer += event.unicode
-                elif event.key == pygame.K_F1 and game_started and not game_over:
-                    cheat_mode = True
-                    cheat_buffer = ""
-                elif event.key == pygame.K_SPACE and not game_over and game_started:
-                    bullet = spaceship.fire()
-                    if bullet:
-                        bullets.add(bullet)
-                        all_sprites.add(bullet)
-                        if gun_sound:
-                            gun_sound.stop()
-                            gun_sound.play()
-                elif event.key == pygame.K_b and not game_over and game_started:
-                    rocket = spaceship.fire_rocket()
-                    if rocket:
-                        rockets.add(rocket)
-                        all_sprites.add(rocket)
-                elif event.key == pygame.K_p:
-                    if not game_started and not starting_transition:
-                        starting_transition = True
-                        starting_transition_timer = 0
-                        if intro_music:
-                            intro_music.stop()
-                        if start_sound:
-                            start_sound.play()
-                            # Calculate duration in frames (get length in seconds, multiply by FPS)
-                            starting_transition_timer = int(start_sound.get_length() * FPS)
-                        else:
-                            # Fallback if sound fails to load
-                            starting_transition_timer = int(2 * FPS)
-                    elif game_over and not entering_name:
-                        game_over = False
-                        starting_transition = True
-                        starting_transition_timer = 0
-                        if intro_music:
-                            intro_music.stop()
-                        if start_sound:
-                            start_sound.play()
-                            starting_transition_timer = int(start_sound.get_length() * FPS)
-                        else:
-                            starting_transition_timer = int(2 * FPS)
-                        current_level = 1
-                        asteroids_spawned_this_level = 0
-                        asteroids_destroyed_this_level = 0
-                        boss_active = False
-                        if boss_instance:
-                            boss_instance.kill()
-                            boss_instance = None
-                        score = 0
-                        entering_name = False
-                        player_name = ""
-                        game_over_delay_timer = 0
-                        
-                        all_sprites.empty()
-                        bullets.empty()
-                        rockets.empty()
-                        asteroids.empty()
-                        explosions.empty()
-                        powerups.empty()
-                        bosses.empty()
-                        fireballs.empty()
-                        
-                        initial_asteroids, max_asteroids, total_asteroids, spawn_interval_seconds = get_level_params(current_level)
-                        spawn_interval_frames = int(spawn_interval_seconds * FPS)
-                        
-                        spaceship = Spaceship(
-                            sprites_static=ship_sheets.get("static", []),
-                            sprites_thrust=ship_sheets.get("thrust", []),
-                            damage_sprites=damage_sprites,
-                            shield_sprites=shield_sprites,
-                            fire_thrust_left=fire_sheets.get("fire_thrust_left", []),
-                            fire_thrust_right=fire_sheets.get("fire_thrust_right", []),
-                            fire_static_left=fire_sheets.get("fire_static_left", []),
-                            fire_static_right=fire_sheets.get("fire_static_right", []),
-                            rocket_sheets=rocket_sheets,
-                            shield_hit_sound=shield_hit_sound,
-                            ship_destroyed_sound=ship_destroyed_sound,
-                            x=WINDOW_WIDTH // 2,
-                            y=WINDOW_HEIGHT // 2,
-                        )
-                        all_sprites.add(spaceship)
-                        
-                        for _ in range(initial_asteroids):
-                            spawn_asteroid()
-                            asteroids_spawned_this_level += 1
-                        spawn_timer = 0
-                        respawn_timer = 0
-        
-        # Get pressed keys
-        keys = pygame.key.get_pressed()
+            elif event.type == KEYDOWN:
+                held_keys.add(event.key)
+                key_handler(event)
+                key_handler = select_key_handler()
+            elif event.type == KEYUP:
+                held_keys.discard(event.key)
         
         # Check for ESC to quit
-        if keys[pygame.K_ESCAPE]:
+        if K_ESCAPE in held_keys:
             running = False
         
-        # Handle starting transition (black screen during start sound)
-        if starting_transition:
-            starting_transition_timer -= 1
-            if starting_transition_timer <= 0:
-                # Transition complete, start the game with fade-in
-                starting_transition = False
-                game_started = True
-                fade_in = True
-                fade_in_timer = FADE_IN_DURATION
-                pygame.mixer.music.play(-1, fade_ms=500)  # Fade in music over 500ms
-            # Draw black screen
-            screen.fill(BLACK)
-            pygame.display.flip()
-            continue
-        
-        # Show start screen if game hasn't started
-        if not game_started:
-            background_manager.draw(screen, BLACK)
-            draw_start_screen(screen)
-            pygame.display.flip()
-            continue
-        
-        # Skip updates if game over
-        if game_over:
-            background_manager.draw(screen, BLACK)
-            draw_game_over(screen, score, high_scores, entering_name, player_name)
+        # Menu screens (start transition, start screen, game over) draw a full
+        # frame of their own and skip the game update
+        menu_frame = select_menu_frame()
+        if menu_frame is not None:
+            menu_frame()
             pygame.display.flip()
+            full_redraw = True
             continue
         
         # Update
-        spaceship.handle_input(keys)
+        spaceship.handle_input(held_keys)
         all_sprites.update()
+        # The ship only leaves all_sprites by killing itself in update() once its
+        # explosion finishes, so this holds for the rest of the frame
+        ship_alive = spaceship.alive()
 
-        # Bullet vs asteroid collisions
-        for asteroid in pygame.sprite.groupcollide(asteroids, bullets, False, True):
+        # Bullet vs asteroid collisions. Asteroid rects are gathered into one list,
+        # parallel to asteroid_list, so each bullet's pair tests run as a single
+        # Rect.collidelist call in C. A bullet is spent on the first asteroid it
+        # touches, so the scan stops at the first hit
+        asteroid_list = asteroids.sprites()
+        asteroid_grid.rebuild(asteroid_list)
+        hit_asteroids = {}
+        if bullets and asteroid_list:
+            asteroid_rects = [asteroid.rect for asteroid in asteroid_list]
+            for bullet in bullets.sprites():
+                hit_index = bullet.rect.collidelist(asteroid_rects)
+                if hit_index >= 0:
+                    bullet.kill()
+                    hit_asteroids[asteroid_list[hit_index]] = None
+        for asteroid in hit_asteroids:
             alive = asteroid.take_damage(1)
             score += 1
             if asteroid_hit_sound:
                 asteroid_hit_sound.play()
             if not alive:
-                score += 10
-                asteroids_destroyed_this_level += 1
-                create_explosion(asteroid.x, asteroid.y, asteroid.rotation, asteroid.rotation_speed, asteroid.vx, asteroid.vy)
-                if asteroid_destroyed_sound:
-                    asteroid_destroyed_sound.play()
-                
-                # Randomly spawn a power-up when asteroid is destroyed
-                if random.random() < POWERUP_SPAWN_CHANCE:
-                    roll = random.random()
-                    if roll < HEALTH_POWERUP_WEIGHT:
-                        powerup_type = PowerUp.HEALTH
-                    elif roll < HEALTH_POWERUP_WEIGHT + INVULNERABILITY_POWERUP_WEIGHT:
-                        powerup_type = PowerUp.INVULNERABILITY
-                    elif roll < HEALTH_POWERUP_WEIGHT + INVULNERABILITY_POWERUP_WEIGHT + ROCKETS_POWERUP_WEIGHT:
-                        powerup_type = PowerUp.ROCKETS
-                    else:
-                        powerup_type = PowerUp.SHIELDS  # Remaining weight
-                    
-                    powerup_sprite = powerup_sprites[powerup_type]
-                    powerup = PowerUp(asteroid.x, asteroid.y, powerup_type, powerup_sprite)
-                    powerups.add(powerup)
-                    all_sprites.add(powerup)
-                
-                # Spawn child asteroids if this is a parent asteroid and level >= 3
-                if asteroid.spawn_children and asteroid.scale == 1.0 and current_level >= 3:
-                    child_scale = 0.5
-                    for i in range(3):
-                        angle = (i * 120) * math.pi / 180
-                        child_speed = 2.0
-                        child_vx = asteroid.vx + math.cos(angle) * child_speed
-                        child_vy = asteroid.vy + math.sin(angle) * child_speed
-                        
-                        offset_dist = 30
-                        child_x = asteroid.x + math.cos(angle) * offset_dist
-                        child_y = asteroid.y + math.sin(angle) * offset_dist
-                        
-                        child_asteroid = Asteroid(asteroid_stage_sheets, 2, child_x, child_y, child_vx, child_vy, 
-                                                 random.uniform(0, 360), random.uniform(*ASTEROID_ROTATION_RANGE),
-                                                 scale=child_scale, spawn_children=False)
-                        asteroids.add(child_asteroid)
-                        all_sprites.add(child_asteroid)
-                
-                asteroid.kill()
-                
-                # Spawn a new asteroid immediately when one is destroyed (if limits allow)
-                if (len(asteroids) < max_asteroids and 
-                    asteroids_spawned_this_level < total_asteroids):
-                    spawn_asteroid()
-                    asteroids_spawned_this_level += 1
-                    spawn_timer = 0
+                destroy_asteroid(asteroid)
         
-        # Rocket vs asteroid collisions (using circle-based collision for smaller hitbox)
-        for rocket in list(rockets):
-            if rocket not in all_sprites:
-                continue
-            hits = pygame.sprite.spritecollide(rocket, asteroids, False, pygame.sprite.collide_circle)
-            if not hits:
-                continue
-            asteroid = hits[0]
-            # Collision! Rocket does 4 damage (destroys in one hit)
-            alive = asteroid.take_damage(4)
-            score += 1
-            rocket.kill()
-            if asteroid_hit_sound:
-                asteroid_hit_sound.play()
-            if not alive:
-                score += 10
-                asteroids_destroyed_this_level += 1
-                create_explosion(asteroid.x, asteroid.y, asteroid.rotation, asteroid.rotation_speed, asteroid.vx, asteroid.vy)
-                if asteroid_destroyed_sound:
-                    asteroid_destroyed_sound.play()
-                
-                # Randomly spawn a power-up when asteroid is destroyed
-                if random.random() < POWERUP_SPAWN_CHANCE:
-                    roll = random.random()
-                    if roll < HEALTH_POWERUP_WEIGHT:
-                        powerup_type = PowerUp.HEALTH
-                    elif roll < HEALTH_POWERUP_WEIGHT + INVULNERABILITY_POWERUP_WEIGHT:
-                        powerup_type = PowerUp.INVULNERABILITY
-                    elif roll < HEALTH_POWERUP_WEIGHT + INVULNERABILITY_POWERUP_WEIGHT + ROCKETS_POWERUP_WEIGHT:
-                        powerup_type = PowerUp.ROCKETS
-                    else:
-                        powerup_type = PowerUp.SHIELDS  # Remaining weight
-                    
-                    powerup_sprite = powerup_sprites[powerup_type]
-                    powerup = PowerUp(asteroid.x, asteroid.y, powerup_type, powerup_sprite)
-                    powerups.add(powerup)
-                    all_sprites.add(powerup)
-                
-                # Spawn child asteroids if this is a parent asteroid and level >= 3
-                if asteroid.spawn_children and asteroid.scale == 1.0 and current_level >= 3:
-                    child_scale = 0.5
-                    for i in range(3):
-                        angle = (i * 120) * math.pi / 180
-                        child_speed = 2.0
-                        child_vx = asteroid.vx + math.cos(angle) * child_speed
-                        child_vy = asteroid.vy + math.sin(angle) * child_speed
-                        
-                        offset_dist = 30
-                        child_x = asteroid.x + math.cos(angle) * offset_dist
-                        child_y = asteroid.y + math.sin(angle) * offset_dist
-                        
-                        child_asteroid = Asteroid(asteroid_stage_sheets, 2, child_x, child_y, child_vx, child_vy, 
-                                                 random.uniform(0, 360), random.uniform(*ASTEROID_ROTATION_RANGE),
-                                                 scale=child_scale, spawn_children=False)
-                        asteroids.add(child_asteroid)
-                        all_sprites.add(child_asteroid)
-                
-                asteroid.kill()
-                
-                # Spawn a new asteroid immediately when one is destroyed (if limits allow)
-                if (len(asteroids) < max_asteroids and 
-                    asteroids_spawned_this_level < total_asteroids):
-                    spawn_asteroid()
-                    asteroids_spawned_this_level += 1
-                    spawn_timer = 0
+        # Rocket vs asteroid collisions (using circle-based collision for smaller hitbox).
+        # sprites() is already a snapshot, so rockets can be killed mid-loop; only a
+        # rocket kills itself here, so every rocket in it is still live when reached
+        if rockets and asteroids:
+            for rocket in rockets.sprites():
+                hits = asteroid_grid.collide(rocket, collide_circle_sq)
+                if not hits:
+                    continue
+                asteroid = hits[0]
+                # Collision! Rocket does 4 damage (destroys in one hit)
+                alive = asteroid.take_damage(4)
+                score += 1
+                rocket.kill()
+                if asteroid_hit_sound:
+                    asteroid_hit_sound.play()
+                if not alive:
+                    destroy_asteroid(asteroid)
         
         # Check for level completion
         if (asteroids_destroyed_this_level >= total_asteroids and 
@@ -584,43 +691,19 @@ def main():
                 boss_fire_timer = 60  # Initial delay before first volley
             else:
                 # Normal level progression
-                current_level += 1
-                asteroids_spawned_this_level = 0
-                asteroids_destroyed_this_level = 0
-                
-                # Update background for new level
-                background_manager.update_background_for_level(current_level)
-                
-                initial_asteroids, max_asteroids, total_asteroids, spawn_interval_seconds = get_level_params(current_level)
-                spawn_interval_frames = int(spawn_interval_seconds * FPS)
-                
-                for _ in range(initial_asteroids):
-                    spawn_asteroid()
-                    asteroids_spawned_this_level += 1
-                spawn_timer = 0
+                start_level(current_level + 1)
         
         # Asteroid vs spaceship collisions
-        if not spaceship.is_exploding and spaceship.spawn_shield <= 0:
-            for asteroid in pygame.sprite.spritecollide(spaceship, asteroids, False, pygame.sprite.collide_circle):
+        if asteroids and not spaceship.is_exploding and spaceship.spawn_shield <= 0:
+            for asteroid in asteroid_grid.collide(spaceship, collide_circle_sq):
                 spaceship.take_damage(asteroid)
                 # Asteroid also takes 1 damage from the collision
                 alive = asteroid.take_damage(1)
                 if asteroid_hit_sound:
                     asteroid_hit_sound.play()
                 if not alive:
-                    score += 10
-                    asteroids_destroyed_this_level += 1
-                    create_explosion(asteroid.x, asteroid.y, asteroid.rotation, asteroid.rotation_speed, asteroid.vx, asteroid.vy)
-                    if asteroid_destroyed_sound:
-                        asteroid_destroyed_sound.play()
-                    asteroid.kill()
-                    
-                    # Spawn a new asteroid immediately when one is destroyed (if limits allow)
-                    if (len(asteroids) < max_asteroids and 
-                        asteroids_spawned_this_level < total_asteroids):
-                        spawn_asteroid()
-                        asteroids_spawned_this_level += 1
-                        spawn_timer = 0
+                    # Rammed asteroids break up without drops or children
+                    destroy_asteroid(asteroid, drops=False)
         
         # Boss battle logic
         if boss_active and boss_instance:
@@ -637,7 +720,7 @@ def main():
             assert boss_instance is not None
             
             # Bullets vs boss
-            for bullet in pygame.sprite.spritecollide(boss_instance, bullets, True):
+            for bullet in spritecollide(boss_instance, bullets, True):
                 if boss_instance.take_damage():
                     # Boss defeated! Save position before cleanup
                     boss_x, boss_y = boss_instance.x, boss_instance.y
@@ -650,23 +733,14 @@ def main():
                     boss_instance = None
                     
                     # Progress to next level
-                    current_level += 1
-                    asteroids_spawned_this_level = 0
-                    asteroids_destroyed_this_level = 0
-                    background_manager.update_background_for_level(current_level)
-                    initial_asteroids, max_asteroids, total_asteroids, spawn_interval_seconds = get_level_params(current_level)
-                    spawn_interval_frames = int(spawn_interval_seconds * FPS)
-                    for _ in range(initial_asteroids):
-                        spawn_asteroid()
-                        asteroids_spawned_this_level += 1
-                    spawn_timer = 0
+                    start_level(current_level + 1)
                     break  # Exit loop after boss defeated
                 else:
                     score += 10
             
             # Rockets vs boss (only if boss still active)
             if boss_instance is not None:
-                for rocket in pygame.sprite.spritecollide(boss_instance, rockets, True):
+                for rocket in spritecollide(boss_instance, rockets, True):
                     # Rockets do 3 damage
                     destroyed = False
                     for _ in range(3):
@@ -686,41 +760,33 @@ def main():
                         boss_instance = None
                         
                         # Progress to next level
-                        current_level += 1
-                        asteroids_spawned_this_level = 0
-                        asteroids_destroyed_this_level = 0
-                        background_manager.update_background_for_level(current_level)
-                        initial_asteroids, max_asteroids, total_asteroids, spawn_interval_seconds = get_level_params(current_level)
-                        spawn_interval_frames = int(spawn_interval_seconds * FPS)
-                        for _ in range(initial_asteroids):
-                            spawn_asteroid()
-                            asteroids_spawned_this_level += 1
-                        spawn_timer = 0
+                        start_level(current_level + 1)
                         break  # Exit loop after boss defeated
                     else:
                         score += 30
             
             # Fireballs vs spaceship
             if not spaceship.is_exploding and spaceship.spawn_shield <= 0:
-                for fireball in pygame.sprite.spritecollide(spaceship, fireballs, True, pygame.sprite.collide_circle):
+                for fireball in spritecollide(spaceship, fireballs, True, collide_circle_sq):
                     spaceship.take_damage()
         
         # Power-up vs spaceship collisions
-        for powerup in pygame.sprite.spritecollide(spaceship, powerups, True):
-            if powerup.power_type == PowerUp.HEALTH:
-                # Increase max health (up to 6) and refill health
-                spaceship.max_health = min(spaceship.max_health + 1, 6)
-                spaceship.health = spaceship.max_health
-            elif powerup.power_type == PowerUp.SHIELDS:
-                # Refill health to max (only if not already at max)
-                if spaceship.health < spaceship.max_health:
+        if powerups:
+            for powerup in spritecollide(spaceship, powerups, True):
+                if powerup.power_type == PowerUp.HEALTH:
+                    # Increase max health (up to 6) and refill health
+                    spaceship.max_health = min(spaceship.max_health + 1, 6)
                     spaceship.health = spaceship.max_health
-            elif powerup.power_type == PowerUp.INVULNERABILITY:
-                # Grant invulnerability
-                spaceship.invulnerability_time = int(INVULNERABILITY_DURATION * FPS)
-            elif powerup.power_type == PowerUp.ROCKETS:
-                # Add rockets
-                spaceship.rockets += NUM_ROCKETS_PER_PICKUP
+                elif powerup.power_type == PowerUp.SHIELDS:
+                    # Refill health to max (only if not already at max)
+                    if spaceship.health < spaceship.max_health:
+                        spaceship.health = spaceship.max_health
+                elif powerup.power_type == PowerUp.INVULNERABILITY:
+                    # Grant invulnerability
+                    spaceship.invulnerability_time = int(INVULNERABILITY_DURATION * FPS)
+                elif powerup.power_type == PowerUp.ROCKETS:
+                    # Add rockets
+                    spaceship.rockets += NUM_ROCKETS_PER_PICKUP
 
         # Maintain asteroid population based on level
         spawn_timer += 1
@@ -732,7 +798,7 @@ def main():
             spawn_timer = 0
         
         # Handle spaceship destruction and game over
-        if spaceship not in all_sprites:
+        if not ship_alive:
             if game_over_delay_timer == 0:
                 # Ship just died, start the delay timer
                 game_over_delay_timer = GAME_OVER_DELAY
@@ -749,23 +815,28 @@ def main():
                         player_name = ""
         
         # Draw
-        background_manager.draw(screen, BLACK)
-        bullets.draw(screen)
-        rockets.draw(screen)
-        asteroids.draw(screen)
-        explosions.draw(screen)
-        powerups.draw(screen)
-        bosses.draw(screen)
-        fireballs.draw(screen)
-        if spaceship in all_sprites:
-            spaceship.draw(screen)
-        draw_health(screen, spaceship.health if spaceship in all_sprites else 0, max_segments=spaceship.max_health if spaceship in all_sprites else 3)
-        if spaceship in all_sprites and spaceship.rockets > 0:
-            draw_rockets(screen, spaceship.rockets)
-        if spaceship in all_sprites and spaceship.invulnerability_time > 0:
-            draw_invulnerability(screen, spaceship.invulnerability_time, fps=FPS)
-        draw_score(screen, score)
-        draw_level(screen, current_level)
+        # Only the areas drawn last frame are restored from the background and sent
+        # to the display; the whole screen is redrawn after a menu, during the
+        # fade-in and when the level background changes
+        current_background = background_manager.get_current_background()
+        full_redraw = full_redraw or fade_in or current_background is not last_background
+        if full_redraw:
+            background_manager.draw(screen, BLACK)
+        else:
+            background_manager.restore(screen, dirty_rects, BLACK)
+        # One blits() call for every group's sprites and the ship (with its
+        # shield) on top, instead of a Python-level blit loop per group
+        blit_items = [(sprite.image, sprite.rect) for group in draw_layers for sprite in group]
+        if ship_alive:
+            blit_items += spaceship.blit_items()
+        drawn_rects = screen.blits(blit_items)
+        drawn_rects.append(draw_health(screen, spaceship.health if ship_alive else 0, max_segments=spaceship.max_health if ship_alive else 3))
+        if ship_alive and spaceship.rockets > 0:
+            drawn_rects.append(draw_rockets(screen, spaceship.rockets))
+        if ship_alive and spaceship.invulnerability_time > 0:
+            drawn_rects.append(draw_invulnerability(screen, spaceship.invulnerability_time, fps=FPS))
+        drawn_rects.append(draw_score(screen, score))
+        drawn_rects.append(draw_level(screen, current_level))
         
         # Apply fade-in effect if active
         if fade_in:
@@ -775,12 +846,17 @@ def main():
             else:
                 # Calculate alpha from 255 (black) to 0 (transparent)
                 alpha = int(255 * (fade_in_timer / FADE_IN_DURATION))
-                fade_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-                fade_surface.fill(BLACK)
                 fade_surface.set_alpha(alpha)
                 screen.blit(fade_surface, (0, 0))
 
-        pygame.display.flip()
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            # Erased areas from the last frame plus everything drawn this frame
+            pygame.display.update(dirty_rects + drawn_rects)
+        dirty_rects = drawn_rects
+        last_background = current_background
+        full_redraw = False
     
     pygame.quit()
 
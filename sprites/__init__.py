@@ -7,5 +7,6 @@ from sprites.explosion import Explosion
 from sprites.powerup import PowerUp
 from sprites.boss import BossShip
 from sprites.fireball import Fireball
+from sprites.group import FastGroup
 
-__all__ = ['Spaceship', 'Bullet', 'Rocket', 'Asteroid', 'Explosion', 'PowerUp', 'BossShip', 'Fireball']
+__all__ = ['Spaceship', 'Bullet', 'Rocket', 'Asteroid', 'Explosion', 'PowerUp', 'BossShip', 'Fireball', 'FastGroup']
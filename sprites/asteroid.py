@@ -3,16 +3,41 @@ import pygame
 import math
 import random
 from constants import WINDOW_WIDTH, WINDOW_HEIGHT, ASTEROID_ROTATION_RANGE
+from sprites.pool import PooledSprite
 
+# Scaled copies of stage sheets, keyed by (id(sprites_by_stage), scale). The
+# source sheets are kept in each entry so their id can't be reused.
+_scaled_stage_cache = {}
 
-class Asteroid(pygame.sprite.Sprite):
+
+def _scaled_stages(sprites_by_stage, scale):
+    """Return sprites_by_stage with every frame scaled, building it on first use."""
+    key = (id(sprites_by_stage), scale)
+    entry = _scaled_stage_cache.get(key)
+    if entry is None or entry[0] is not sprites_by_stage:
+        scaled = [
+            [pygame.transform.scale(img, (int(img.get_width() * scale), int(img.get_height() * scale))) for img in sheet]
+            for sheet in sprites_by_stage
+        ]
+        entry = _scaled_stage_cache[key] = (sprites_by_stage, scaled)
+    return entry[1]
+
+
+class Asteroid(PooledSprite):
     """Asteroid that can progress through visual stages when shot."""
 
     def __init__(self, sprites_by_stage, stage_index, x, y, vx, vy, rotation, rotation_speed, scale=1.0, spawn_children=True):
         super().__init__()
+        self.reset(sprites_by_stage, stage_index, x, y, vx, vy, rotation, rotation_speed, scale, spawn_children)
+
+    def reset(self, sprites_by_stage, stage_index, x, y, vx, vy, rotation, rotation_speed, scale=1.0, spawn_children=True):
+        # Frames are scaled once per sheet set and scale, not on every frame change
+        if scale != 1.0:
+            sprites_by_stage = _scaled_stages(sprites_by_stage, scale)
         self.sprites_by_stage = sprites_by_stage
         self.stage_index = stage_index
         self.sprites = self.sprites_by_stage[self.stage_index]
+        self.frames_per_degree = len(self.sprites) / 360.0
         self.rotation = rotation
         self.rotation_speed = rotation_speed
         self.current_frame = 0
@@ -20,13 +45,7 @@ class Asteroid(pygame.sprite.Sprite):
         self.spawn_children = spawn_children  # Whether to spawn child asteroids when destroyed
         self.hit_points = 4  # Each asteroid has 4 health (one per stage)
         
-        # Load and scale the image
-        original_image = self.sprites[self.current_frame]
-        if scale != 1.0:
-            new_size = (int(original_image.get_width() * scale), int(original_image.get_height() * scale))
-            self.image = pygame.transform.scale(original_image, new_size)
-        else:
-            self.image = original_image
+        self.image = self.sprites[self.current_frame]
         
         self.rect = self.image.get_rect(center=(x, y))
         # Circle hitbox at ~80% of sprite diameter (radius = 0.4 * width)
@@ -39,17 +58,10 @@ class Asteroid(pygame.sprite.Sprite):
     def update(self):
         # Spin
         self.rotation = (self.rotation + self.rotation_speed) % 360
-        num_frames = len(self.sprites)
-        frame_index = int((self.rotation / 360.0) * num_frames) % num_frames
+        frame_index = int(self.rotation * self.frames_per_degree) % len(self.sprites)
         if frame_index != self.current_frame:
             self.current_frame = frame_index
-            original_image = self.sprites[self.current_frame]
-            # Apply scaling if needed
-            if self.scale != 1.0:
-                new_size = (int(original_image.get_width() * self.scale), int(original_image.get_height() * self.scale))
-                self.image = pygame.transform.scale(original_image, new_size)
-            else:
-                self.image = original_image
+            self.image = self.sprites[self.current_frame]
 
         # Move
         self.x += self.vx
@@ -72,17 +84,10 @@ class Asteroid(pygame.sprite.Sprite):
             return False
         self.stage_index = next_index
         self.sprites = self.sprites_by_stage[self.stage_index]
+        self.frames_per_degree = len(self.sprites) / 360.0
         # Preserve rotation mapping to keep frame continuity
-        num_frames = len(self.sprites)
-        frame_index = int((self.rotation / 360.0) * num_frames) % num_frames
-        self.current_frame = frame_index
-        original_image = self.sprites[self.current_frame]
-        # Apply scaling if needed
-        if self.scale != 1.0:
-            new_size = (int(original_image.get_width() * self.scale), int(original_image.get_height() * self.scale))
-            self.image = pygame.transform.scale(original_image, new_size)
-        else:
-            self.image = original_image
+        self.current_frame = int(self.rotation * self.frames_per_degree) % len(self.sprites)
+        self.image = self.sprites[self.current_frame]
         return True
 
     def take_damage(self, damage):
@@ -1,16 +1,27 @@
 """Bullet sprite class."""
 import pygame
 from constants import WINDOW_WIDTH, WINDOW_HEIGHT, BULLET_SPEED, BULLET_LIFETIME
+from sprites.pool import PooledSprite
 
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(PooledSprite):
     """Simple bullet shot from the spaceship."""
 
+    # Every bullet looks the same, so they all share one image built on first use
+    _shared_image = None
+
     def __init__(self, x, y, vx, vy):
         super().__init__()
-        self.image = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 255, 255), (2, 2), 2)
-        self.rect = self.image.get_rect(center=(x, y))
+        if Bullet._shared_image is None:
+            image = pygame.Surface((4, 4), pygame.SRCALPHA)
+            pygame.draw.circle(image, (255, 255, 255), (2, 2), 2)
+            Bullet._shared_image = image.convert_alpha()
+        self.image = Bullet._shared_image
+        self.rect = self.image.get_rect()
+        self.reset(x, y, vx, vy)
+
+    def reset(self, x, y, vx, vy):
+        self.rect.center = (x, y)
         self.x = float(x)
         self.y = float(y)
         self.vx = vx
@@ -21,14 +32,8 @@ class Bullet(pygame.sprite.Sprite):
         self.x += self.vx
         self.y += self.vy
         # Screen wrap for bullets to keep gameplay consistent
-        if self.x < 0:
-            self.x = WINDOW_WIDTH
-        elif self.x > WINDOW_WIDTH:
-            self.x = 0
-        if self.y < 0:
-            self.y = WINDOW_HEIGHT
-        elif self.y > WINDOW_HEIGHT:
-            self.y = 0
+        self.x %= WINDOW_WIDTH
+        self.y %= WINDOW_HEIGHT
         self.rect.center = (int(self.x), int(self.y))
         self.life -= 1
         if self.life <= 0:
@@ -1,13 +1,16 @@
 """Explosion sprite class."""
-import pygame
 from constants import WINDOW_WIDTH, WINDOW_HEIGHT
+from sprites.pool import PooledSprite
 
 
-class Explosion(pygame.sprite.Sprite):
+class Explosion(PooledSprite):
     """Explosion that keeps drifting and spinning with the destroyed asteroid."""
 
     def __init__(self, broken_sheets, x, y, rotation_angle, rotation_speed, vx, vy, frame_hold=4):
         super().__init__()
+        self.reset(broken_sheets, x, y, rotation_angle, rotation_speed, vx, vy, frame_hold)
+
+    def reset(self, broken_sheets, x, y, rotation_angle, rotation_speed, vx, vy, frame_hold=4):
         self.broken_sheets = broken_sheets  # list of directional sheets
         self.frame_hold = frame_hold
         self.tick = 0
@@ -26,25 +29,22 @@ class Explosion(pygame.sprite.Sprite):
         sheet = self.broken_sheets[self.frame_index]
         num_frames = len(sheet)
         dir_index = int((self.rotation / 360.0) * num_frames) % num_frames
-        self.image = sheet[dir_index]
-        if self.rect:
-            center = self.rect.center
-            self.rect = self.image.get_rect(center=center)
-        else:
-            self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
+        image = sheet[dir_index]
+        # Most ticks land on the same stage and direction frame as the last one
+        if image is self.image:
+            return
+        self.image = image
+        if self.rect is None:
+            self.rect = image.get_rect(center=(int(self.x), int(self.y)))
+        elif self.rect.size != image.get_size():
+            self.rect = image.get_rect(center=self.rect.center)
 
     def update(self):
         # Drift forward with preserved velocity
         self.x += self.vx
         self.y += self.vy
-        if self.x < 0:
-            self.x = WINDOW_WIDTH
-        elif self.x > WINDOW_WIDTH:
-            self.x = 0
-        if self.y < 0:
-            self.y = WINDOW_HEIGHT
-        elif self.y > WINDOW_HEIGHT:
-            self.y = 0
+        self.x %= WINDOW_WIDTH
+        self.y %= WINDOW_HEIGHT
         if self.rect:
             self.rect.center = (int(self.x), int(self.y))
 
@@ -57,7 +57,5 @@ class Explosion(pygame.sprite.Sprite):
             if self.frame_index >= len(self.broken_sheets):
                 self.kill()
                 return
-            self._set_image()
-        else:
-            # Update frame for current rotation even within the same explosion stage
-            self._set_image()
+        # Update frame for current rotation even within the same explosion stage
+        self._set_image()
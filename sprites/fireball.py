@@ -58,14 +58,8 @@ class Fireball(pygame.sprite.Sprite):
         self.y += self.vy
         
         # Screen wrap
-        if self.x < 0:
-            self.x = WINDOW_WIDTH
-        elif self.x > WINDOW_WIDTH:
-            self.x = 0
-        if self.y < 0:
-            self.y = WINDOW_HEIGHT
-        elif self.y > WINDOW_HEIGHT:
-            self.y = 0
+        self.x %= WINDOW_WIDTH
+        self.y %= WINDOW_HEIGHT
         
         self.rect.center = (int(self.x), int(self.y))
         self._update_image()
@@ -0,0 +1,36 @@
+"""List-backed sprite group."""
+import pygame
+
+
+class FastGroup(pygame.sprite.Group):
+    """Group that keeps its sprites in a plain list alongside pygame's dict.
+
+    Iteration and sprites() walk the list (a cheap slice copy) instead of
+    rebuilding a list from the dict keys; membership tests still use the dict.
+    The list stays in insertion order, so draw order matches Group.
+    """
+
+    def __init__(self, *sprites):
+        self._sprite_list = []
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._sprite_list.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._sprite_list.remove(sprite)
+
+    def sprites(self):
+        # A copy, so sprites can kill themselves while the caller iterates
+        return self._sprite_list[:]
+
+    def __iter__(self):
+        return iter(self._sprite_list[:])
+
+    def __len__(self):
+        return len(self._sprite_list)
+
+    def __bool__(self):
+        return bool(self._sprite_list)
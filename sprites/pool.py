@@ -0,0 +1,32 @@
+"""Base class for sprites that are recycled instead of reallocated."""
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite that returns itself to a per-class free list when killed.
+
+    Subclasses must define reset(), taking the same arguments as __init__ and
+    reinitializing all per-instance state; __init__ calls it after the base
+    constructor, and spawn() calls it on recycled instances. Create them with
+    spawn() instead of the constructor so killed instances get reused.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    @classmethod
+    def spawn(cls, *args, **kwargs):
+        """Return a recycled instance reset with the given arguments, or a new one."""
+        if cls._pool:
+            sprite = cls._pool.pop()
+            sprite.reset(*args, **kwargs)
+            return sprite
+        return cls(*args, **kwargs)
+
+    def kill(self):
+        """Remove the sprite from all groups and make it available to spawn()."""
+        # Guard so a sprite killed twice isn't handed out twice
+        if self.alive():
+            super().kill()
+            self._pool.append(self)
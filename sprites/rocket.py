@@ -71,14 +71,8 @@ class Rocket(pygame.sprite.Sprite):
         self.y += self.vy
         
         # Screen wrap
-        if self.x < 0:
-            self.x = WINDOW_WIDTH
-        elif self.x > WINDOW_WIDTH:
-            self.x = 0
-        if self.y < 0:
-            self.y = WINDOW_HEIGHT
-        elif self.y > WINDOW_HEIGHT:
-            self.y = 0
+        self.x %= WINDOW_WIDTH
+        self.y %= WINDOW_HEIGHT
         
         # Cycle through animation frames
         # Rockets animate faster than bullets live, so cycle through 4 sprite sheets
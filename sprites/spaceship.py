@@ -1,10 +1,15 @@
 """Spaceship sprite class."""
 import pygame
 import math
+from pygame.locals import K_LEFT, K_RIGHT, K_UP
 from constants import WINDOW_WIDTH, WINDOW_HEIGHT, BULLET_SPEED, SHIP_DRIFT_DECAY, MAX_SHIELDS, UNLIMITED_ROCKETS, ROCKET_SPEED_MULTIPLIER
 from sprites.bullet import Bullet
 from sprites.rocket import Rocket
 
+# Unit thrust vectors keyed by ship rotation in degrees. Rotation only moves in
+# rotation_speed steps, so this fills up with a few dozen headings
+_thrust_directions = {}
+
 
 class Spaceship(pygame.sprite.Sprite):
     """Spaceship with asteroid-like movement physics"""
@@ -29,6 +34,15 @@ class Spaceship(pygame.sprite.Sprite):
         self.ship_destroyed_sound = ship_destroyed_sound  # Sound to play when ship is destroyed
         self.rocket_sound = rocket_sound  # Sound to play when launching rockets
         self.current_frame = 0
+        self._sprite_key = None  # inputs of the last _update_sprite frame pick
+        # Unit firing vector for each sprite frame, so bullets and rockets leave
+        # along the facing the player sees (0 degrees is up, hence the -90 offset)
+        frame_count = len(self.sprites_static) or 24
+        frame_step = 360.0 / frame_count
+        self.frame_directions = []
+        for frame in range(frame_count):
+            rad = math.radians(frame * frame_step - 90)
+            self.frame_directions.append((math.cos(rad), math.sin(rad)))
         # Provide a safe placeholder if assets are missing
         if self.sprites_static:
             self.image = self.sprites_static[self.current_frame]
@@ -82,17 +96,18 @@ class Spaceship(pygame.sprite.Sprite):
         self.max_velocity = 10.0
         self.drift_decay = SHIP_DRIFT_DECAY
         
-    def handle_input(self, keys):
-        """Handle keyboard input"""
-        self.is_rotating_left = keys[pygame.K_LEFT]
-        self.is_rotating_right = keys[pygame.K_RIGHT]
-        self.is_thrusting = keys[pygame.K_UP]
-        # Fire cooldown ticks down while holding space
-        if self.fire_cooldown > 0:
-            self.fire_cooldown -= 1
+    def handle_input(self, held_keys):
+        """Handle keyboard input from the set of key codes currently held down"""
+        self.is_rotating_left = K_LEFT in held_keys
+        self.is_rotating_right = K_RIGHT in held_keys
+        self.is_thrusting = K_UP in held_keys
     
     def update(self):
         """Update spaceship position and rotation"""
+        # Fire cooldown ticks down once per frame
+        if self.fire_cooldown > 0:
+            self.fire_cooldown -= 1
+        
         # If exploding, skip movement/control updates but handle explosion animation
         if self.is_exploding:
             # Continue drifting with current velocity during explosion
@@ -100,14 +115,8 @@ class Spaceship(pygame.sprite.Sprite):
             self.y += self.velocity_y
             
             # Screen wrapping
-            if self.x < 0:
-                self.x = WINDOW_WIDTH
-            elif self.x > WINDOW_WIDTH:
-                self.x = 0
-            if self.y < 0:
-                self.y = WINDOW_HEIGHT
-            elif self.y > WINDOW_HEIGHT:
-                self.y = 0
+            self.x %= WINDOW_WIDTH
+            self.y %= WINDOW_HEIGHT
             
             alive = self.update_explosion()
             if alive:
@@ -126,15 +135,18 @@ class Spaceship(pygame.sprite.Sprite):
         
         # Handle thrust
         if self.is_thrusting:
-            # Convert rotation to radians (0 degrees is up, so we use -90 offset)
-            rad = math.radians(self.rotation - 90)
-            self.velocity_x += self.acceleration * math.cos(rad)
-            self.velocity_y += self.acceleration * math.sin(rad)
+            direction = _thrust_directions.get(self.rotation)
+            if direction is None:
+                # Convert rotation to radians (0 degrees is up, so we use -90 offset)
+                rad = math.radians(self.rotation - 90)
+                direction = _thrust_directions[self.rotation] = (math.cos(rad), math.sin(rad))
+            self.velocity_x += self.acceleration * direction[0]
+            self.velocity_y += self.acceleration * direction[1]
             
-            # Limit velocity
-            velocity_magnitude = math.sqrt(self.velocity_x**2 + self.velocity_y**2)
-            if velocity_magnitude > self.max_velocity:
-                scale = self.max_velocity / velocity_magnitude
+            # Limit velocity, taking the square root only when clamping
+            speed_sq = self.velocity_x * self.velocity_x + self.velocity_y * self.velocity_y
+            if speed_sq > self.max_velocity * self.max_velocity:
+                scale = self.max_velocity / math.sqrt(speed_sq)
                 self.velocity_x *= scale
                 self.velocity_y *= scale
         else:
@@ -147,15 +159,8 @@ class Spaceship(pygame.sprite.Sprite):
         self.y += self.velocity_y
         
         # Screen wrapping
-        if self.x < 0:
-            self.x = WINDOW_WIDTH
-        elif self.x > WINDOW_WIDTH:
-            self.x = 0
-            
-        if self.y < 0:
-            self.y = WINDOW_HEIGHT
-        elif self.y > WINDOW_HEIGHT:
-            self.y = 0
+        self.x %= WINDOW_WIDTH
+        self.y %= WINDOW_HEIGHT
         
         # Update sprite based on rotation
         self._update_sprite()
@@ -191,6 +196,12 @@ class Spaceship(pygame.sprite.Sprite):
     
     def _update_sprite(self):
         """Update sprite frame based on current rotation, thrust state, and damage"""
+        # The frame only depends on these; most frames none of them change
+        key = (self.rotation, self.is_thrusting, self.firing_timer > 0, self.fire_side,
+               self.is_exploding, self.explosion_frame)
+        if key == self._sprite_key:
+            return
+        self._sprite_key = key
         if self.is_exploding:
             # Show damage progression animation
             sheet = self.damage_sprites[self.explosion_frame]
@@ -218,14 +229,7 @@ class Spaceship(pygame.sprite.Sprite):
         if self.fire_cooldown > 0 or self.is_exploding:
             return None
         # Quantize firing direction to the current sprite frame so bullets align with visible facing
-        frame_count = len(self.sprites_static) if self.sprites_static else 0
-        if frame_count <= 0:
-            frame_count = 24
-        frame_step = 360.0 / frame_count
-        quantized_rotation = self.current_frame * frame_step
-        rad = math.radians(quantized_rotation - 90)
-        dir_x = math.cos(rad)
-        dir_y = math.sin(rad)
+        dir_x, dir_y = self.frame_directions[self.current_frame]
         # Alternate gun origin offset left/right for visual polish
         # Perpendicular vector to forward direction
         perp_x = -dir_y
@@ -234,7 +238,7 @@ class Spaceship(pygame.sprite.Sprite):
         side_mult = 1 if self.fire_side == 'left' else -1
         origin_x = self.rect.centerx + dir_x * 20 + perp_x * gun_offset * side_mult
         origin_y = self.rect.centery + dir_y * 20 + perp_y * gun_offset * side_mult
-        bullet = Bullet(origin_x, origin_y, dir_x * BULLET_SPEED, dir_y * BULLET_SPEED)
+        bullet = Bullet.spawn(origin_x, origin_y, dir_x * BULLET_SPEED, dir_y * BULLET_SPEED)
         self.fire_cooldown = 8  # small delay between shots
         # Trigger firing animation and alternate side
         self.firing_timer = self.firing_duration
@@ -257,14 +261,7 @@ class Spaceship(pygame.sprite.Sprite):
         if not UNLIMITED_ROCKETS:
             self.rockets -= 1
         
-        frame_count = len(self.sprites_static) if self.sprites_static else 0
-        if frame_count <= 0:
-            frame_count = 24
-        frame_step = 360.0 / frame_count
-        quantized_rotation = self.current_frame * frame_step
-        rad = math.radians(quantized_rotation - 90)
-        dir_x = math.cos(rad)
-        dir_y = math.sin(rad)
+        dir_x, dir_y = self.frame_directions[self.current_frame]
         # Perpendicular vector to forward direction
         perp_x = -dir_y
         perp_y = dir_x
@@ -311,11 +308,12 @@ class Spaceship(pygame.sprite.Sprite):
                 # Calculate collision normal (from asteroid to ship)
                 dx = self.x - asteroid.x
                 dy = self.y - asteroid.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                if distance > 0:
-                    # Normalize collision normal
-                    nx = dx / distance
-                    ny = dy / distance
+                dist_sq = dx * dx + dy * dy
+                if dist_sq > 0:
+                    # Normalize collision normal with one reciprocal square root
+                    inv_dist = dist_sq ** -0.5
+                    nx = dx * inv_dist
+                    ny = dy * inv_dist
                     
                     # Calculate relative velocity along collision normal
                     dvx = self.velocity_x - asteroid.vx
@@ -343,12 +341,12 @@ class Spaceship(pygame.sprite.Sprite):
                 return False  # Fully destroyed
         return True
     
-    def draw(self, surface):
-        """Draw the spaceship"""
-        surface.blit(self.image, self.rect)
+    def blit_items(self):
+        """Return the (image, rect) pairs to blit for the ship and its shield"""
+        items = [(self.image, self.rect)]
         # Draw shield animation if active
         if self.shield_active and self.shield_sprites:
             shield_img = self.shield_sprites[self.shield_frame]
             # Center the shield on the spaceship
-            shield_rect = shield_img.get_rect(center=self.rect.center)
-            surface.blit(shield_img, shield_rect)
+            items.append((shield_img, shield_img.get_rect(center=self.rect.center)))
+        return items
@@ -1,17 +1,48 @@
 """UI drawing functions and high score management."""
 import pygame
 import json
+from bisect import insort
 from constants import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, MAX_SHIELDS
 
+# Fonts by size, and rendered text by (size, text, color). Cached surfaces are
+# shared, so callers only blit them
+_FONT_CACHE = {}
+_TEXT_CACHE = {}
+_TEXT_CACHE_LIMIT = 64
+# Length of the pre-rendered dot run the high score leaders are cut from, well
+# over what fits between the columns
+_LEADER_DOTS = 300
+
+
+def get_font(size):
+    """Return the default font at the given size, loading it once."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+
+def render_text(size, text, color=WHITE):
+    """Return a cached antialiased render of text that is redrawn every frame."""
+    key = (size, text, color)
+    image = _TEXT_CACHE.get(key)
+    if image is None:
+        # Score text is never seen again once it changes, so don't let it pile up
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_LIMIT:
+            _TEXT_CACHE.clear()
+        image = _TEXT_CACHE[key] = get_font(size).render(text, True, color)
+    return image
+
 
 def draw_health(surface, health, max_segments=3, position=(10, 10), size=(30, 10), gap=6):
-    """Draw a segmented health (shield) bar."""
+    """Draw a segmented health (shield) bar and return the area drawn."""
     x, y = position
     w, h = size
     for i in range(max_segments):
         color = (0, 220, 120) if i < health else (70, 70, 70)
         pygame.draw.rect(surface, color, (x + i * (w + gap), y, w, h), border_radius=3)
         pygame.draw.rect(surface, (20, 20, 20), (x + i * (w + gap), y, w, h), width=1, border_radius=3)
+    return pygame.Rect(x, y, max(0, max_segments * (w + gap) - gap), h)
 
 
 def draw_shields(surface, shields, max_shields=MAX_SHIELDS, position=(10, 25), size=(30, 10), gap=6):
@@ -25,52 +56,47 @@ def draw_shields(surface, shields, max_shields=MAX_SHIELDS, position=(10, 25), s
 
 
 def draw_rockets(surface, rockets, position=(10, 40)):
-    """Draw rocket count."""
-    font = pygame.font.Font(None, 28)
-    text = font.render(f"Rockets: {rockets}", True, (255, 165, 0))
-    surface.blit(text, position)
+    """Draw rocket count and return the area drawn."""
+    text = render_text(28, f"Rockets: {rockets}", (255, 165, 0))
+    return surface.blit(text, position)
 
 
 def draw_invulnerability(surface, invulnerability_time, fps=60, position=(10, 60)):
-    """Draw invulnerability timer."""
+    """Draw invulnerability timer and return the area drawn (None if inactive)."""
     if invulnerability_time > 0:
         seconds = invulnerability_time / fps
-        font = pygame.font.Font(None, 28)
-        text = font.render(f"Invulnerable: {seconds:.1f}s", True, (255, 100, 255))
-        surface.blit(text, position)
+        text = render_text(28, f"Invulnerable: {seconds:.1f}s", (255, 100, 255))
+        return surface.blit(text, position)
+    return None
 
 
 def draw_score(surface, score, position=None):
-    """Draw the score counter in the upper right."""
-    font = pygame.font.Font(None, 36)
-    text = font.render(f"Score: {score}", True, WHITE)
+    """Draw the score counter in the upper right and return the area drawn."""
+    text = render_text(36, f"Score: {score}")
     if position is None:
         # Default to upper right with padding
         position = (WINDOW_WIDTH - text.get_width() - 10, 10)
-    surface.blit(text, position)
+    return surface.blit(text, position)
 
 
 def draw_level(surface, level, position=None):
-    """Draw the level counter."""
-    font = pygame.font.Font(None, 36)
-    text = font.render(f"Level: {level}", True, WHITE)
+    """Draw the level counter and return the area drawn."""
+    text = render_text(36, f"Level: {level}")
     if position is None:
         # Default to upper center
         position = (WINDOW_WIDTH // 2 - text.get_width() // 2, 10)
-    surface.blit(text, position)
+    return surface.blit(text, position)
 
 
 def draw_game_over(surface, score, high_scores, entering_name=False, current_name=""):
     """Draw game over screen with score and restart prompt."""
     # Game Over title
-    title_font = pygame.font.Font(None, 72)
-    title_text = title_font.render("GAME OVER", True, WHITE)
+    title_text = render_text(72, "GAME OVER")
     title_pos = (WINDOW_WIDTH // 2 - title_text.get_width() // 2, 50)
     surface.blit(title_text, title_pos)
     
     # Score display
-    score_font = pygame.font.Font(None, 48)
-    score_text = score_font.render(f"Final Score: {score}", True, WHITE)
+    score_text = render_text(48, f"Final Score: {score}")
     score_pos = (WINDOW_WIDTH // 2 - score_text.get_width() // 2, 120)
     surface.blit(score_text, score_pos)
     
@@ -82,8 +108,7 @@ def draw_game_over(surface, score, high_scores, entering_name=False, current_nam
         draw_high_scores(surface, high_scores, 200)
         
         # Restart prompt
-        prompt_font = pygame.font.Font(None, 36)
-        prompt_text = prompt_font.render("Press 'P' to play again", True, WHITE)
+        prompt_text = render_text(36, "Press 'P' to play again")
         prompt_pos = (WINDOW_WIDTH // 2 - prompt_text.get_width() // 2, WINDOW_HEIGHT - 100)
         surface.blit(prompt_text, prompt_pos)
 
@@ -91,14 +116,12 @@ def draw_game_over(surface, score, high_scores, entering_name=False, current_nam
 def draw_start_screen(surface):
     """Draw start screen with game title and start prompt."""
     # Game title
-    title_font = pygame.font.Font(None, 96)
-    title_text = title_font.render("Logastroids", True, WHITE)
+    title_text = render_text(96, "Logastroids")
     title_pos = (WINDOW_WIDTH // 2 - title_text.get_width() // 2, WINDOW_HEIGHT // 3)
     surface.blit(title_text, title_pos)
     
     # Start prompt
-    prompt_font = pygame.font.Font(None, 36)
-    prompt_text = prompt_font.render("Press 'P' to start", True, WHITE)
+    prompt_text = render_text(36, "Press 'P' to start")
     prompt_pos = (WINDOW_WIDTH // 2 - prompt_text.get_width() // 2, WINDOW_HEIGHT // 2 + 100)
     surface.blit(prompt_text, prompt_pos)
 
@@ -107,9 +130,12 @@ def load_high_scores(filename="high_scores.json"):
     """Load high scores from file."""
     try:
         with open(filename, 'r') as f:
-            return json.load(f)
+            scores = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return []
+    # Keep the list highest first, which is_high_score and add_high_score rely on
+    scores.sort(key=lambda x: x['score'], reverse=True)
+    return scores
 
 
 def save_high_scores(scores, filename="high_scores.json"):
@@ -122,20 +148,20 @@ def is_high_score(score, high_scores, max_entries=10):
     """Check if score qualifies for the high score list."""
     if len(high_scores) < max_entries:
         return True
-    return score > min(s['score'] for s in high_scores)
+    # The list is sorted highest first, so the last entry is the lowest
+    return score > high_scores[-1]['score']
 
 
 def add_high_score(name, score, level, high_scores, max_entries=10):
     """Add a new high score and return updated list."""
-    high_scores.append({'name': name, 'score': score, 'level': level})
-    high_scores.sort(key=lambda x: x['score'], reverse=True)
+    # Insert into the already sorted list, after any entries with the same score
+    insort(high_scores, {'name': name, 'score': score, 'level': level}, key=lambda x: -x['score'])
     return high_scores[:max_entries]
 
 
 def draw_high_scores(surface, high_scores, y_start=250):
     """Draw the high scores table with formatted layout."""
-    title_font = pygame.font.Font(None, 48)
-    title_text = title_font.render("HIGH SCORES", True, WHITE)
+    title_text = render_text(48, "HIGH SCORES")
     title_pos = (WINDOW_WIDTH // 2 - title_text.get_width() // 2, y_start)
     surface.blit(title_text, title_pos)
     
@@ -143,7 +169,10 @@ def draw_high_scores(surface, high_scores, y_start=250):
     padding = int(WINDOW_WIDTH * 0.3)
     usable_width = WINDOW_WIDTH - (2 * padding)
     
-    score_font = pygame.font.Font(None, 32)
+    # Dot leaders are cropped from one long run of dots rendered once, so the
+    # dots for each row are a blit of part of it rather than a render
+    dot_width = get_font(32).size(".")[0]
+    leader = render_text(32, "." * _LEADER_DOTS, (100, 100, 100))  # Gray dots
     y_offset = y_start + 50
     
     for i, entry in enumerate(high_scores[:10]):
@@ -156,11 +185,11 @@ def draw_high_scores(surface, high_scores, y_start=250):
         
         # Draw rank and name on left
         left_text = f"{rank} {name}"
-        left_surface = score_font.render(left_text, True, WHITE)
+        left_surface = render_text(32, left_text)
         left_x = padding
         
         # Draw score on right
-        right_surface = score_font.render(score_text, True, WHITE)
+        right_surface = render_text(32, score_text)
         right_x = WINDOW_WIDTH - padding - right_surface.get_width()
         
         # Calculate dots width
@@ -168,19 +197,15 @@ def draw_high_scores(surface, high_scores, y_start=250):
         dots_end_x = right_x - 10
         dots_width = dots_end_x - dots_start_x
         
-        # Create dots string to fill the space
-        dot_char = "."
-        dot_width = score_font.size(dot_char)[0]
-        num_dots = max(0, int(dots_width / dot_width))
-        dots = dot_char * num_dots
+        # Whole dots that fit the space
+        num_dots = min(max(0, int(dots_width / dot_width)), _LEADER_DOTS)
         
         y_pos = y_offset + i * 35
         
         # Draw all parts
         surface.blit(left_surface, (left_x, y_pos))
         if num_dots > 0:
-            dots_surface = score_font.render(dots, True, (100, 100, 100))  # Gray dots
-            surface.blit(dots_surface, (dots_start_x, y_pos))
+            surface.blit(leader, (dots_start_x, y_pos), (0, 0, num_dots * dot_width, leader.get_height()))
         surface.blit(right_surface, (right_x, y_pos))
 
 
@@ -199,19 +224,16 @@ def draw_name_entry(surface, current_name, y_pos=400):
     pygame.draw.rect(surface, WHITE, (box_x, box_y, box_width, box_height), 3, border_radius=10)
     
     # Draw prompt text
-    prompt_font = pygame.font.Font(None, 36)
-    prompt_text = prompt_font.render("NEW HIGH SCORE!", True, WHITE)
+    prompt_text = render_text(36, "NEW HIGH SCORE!")
     prompt_pos = (WINDOW_WIDTH // 2 - prompt_text.get_width() // 2, box_y + 30)
     surface.blit(prompt_text, prompt_pos)
     
     # Draw input box
-    input_font = pygame.font.Font(None, 48)
-    input_text = input_font.render(current_name + "_", True, WHITE)
+    input_text = render_text(48, current_name + "_")
     input_pos = (WINDOW_WIDTH // 2 - input_text.get_width() // 2, box_y + 80)
     surface.blit(input_text, input_pos)
     
     # Draw instruction
-    inst_font = pygame.font.Font(None, 24)
-    inst_text = inst_font.render("Enter your name and press ENTER (12 chars max)", True, (200, 200, 200))
+    inst_text = render_text(24, "Enter your name and press ENTER (12 chars max)", (200, 200, 200))
     inst_pos = (WINDOW_WIDTH // 2 - inst_text.get_width() // 2, box_y + 140)
     surface.blit(inst_text, inst_pos)
@@ -13,9 +13,11 @@ from .assets import (
     FIREBALL_SPEC,
     SpriteSheetSpec,
     load_sheet,
+    preload_sheets,
     load_specs_dict,
     load_specs_list,
     load_powerup_sprites,
+    POWERUP_SPEC,
 )
 
 
@@ -33,7 +35,7 @@ def load_spritesheet(filepath, cols, rows, sprite_width, sprite_height):
         return sprites
     except Exception as e:
         # Fallback placeholder to avoid blank screen if asset missing/failed load
-        placeholder = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA)
+        placeholder = pygame.Surface((sprite_width, sprite_height), pygame.SRCALPHA).convert_alpha()
         placeholder.fill((255, 0, 255, 200))  # magenta debug color
         print(f"Warning: failed to load {filepath}: {e}. Using placeholder.")
         return [placeholder.copy() for _ in range(cols * rows)]